@@ -24,13 +24,18 @@ Features:
 
 import asyncio
 import hashlib
+import itertools
+import json
 import logging
+import mmap
+import os
 import struct
 import time
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Callable
+from typing import Dict, Iterable, List, Optional, Tuple, Callable
 import sys
 
 # Add lib to path
@@ -50,6 +55,11 @@ except ImportError:
     TIER_ISD_AS = {"CORE": "1-ff00:0:432", "COMN": "2-ff00:0:528", "PAC": "3-ff00:0:741"}
     TIER_FREQUENCIES = {"CORE": 432, "COMN": 528, "PAC": 741}
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("hercules-transfer")
@@ -59,6 +69,61 @@ GENESIS_BOND_ID = "GB-2025-0524-DRH-LCS-001"
 HERCULES_PORT = 54001
 CHUNK_SIZE = 64 * 1024  # 64KB chunks
 MAX_PATHS = 4  # Maximum paths for aggregation
+SIMULATED_PATH_RATE = 100 * 1024 * 1024  # ~100MB/s per simulated path
+MBPS_SCALE = 8.0 / (1024 * 1024)  # bytes/s -> Mbps
+HASH_LEAF_SIZE = 4 * 1024 * 1024  # Merkle leaf size for tree_digest
+
+
+def _leaf_digest(data: bytes) -> bytes:
+    """Raw 64-bit digest (8-byte BLAKE2b)."""
+    return hashlib.blake2b(data, digest_size=8).digest()
+
+
+def data_digest(data: bytes) -> str:
+    """
+    64-bit integrity fingerprint of transfer data (not authentication).
+
+    Always 8-byte BLAKE2b from hashlib, so every host computes the same
+    data_hash for the same payload.
+    """
+    return _leaf_digest(data).hex()
+
+
+async def tree_digest(data: bytes) -> str:
+    """
+    Merkle-style fingerprint of a payload, hashed in parallel.
+
+    Payloads up to HASH_LEAF_SIZE hash exactly like data_digest().
+    Larger payloads are split into fixed-size leaves hashed concurrently
+    on the default executor (hashlib releases the GIL), and the root
+    is the digest of the concatenated leaf digests.
+
+    Leaves are only released once every executor job hashing them has
+    finished, including when the digest is cancelled.
+    """
+    view = memoryview(data)
+    if len(view) <= HASH_LEAF_SIZE:
+        return data_digest(view)
+
+    loop = asyncio.get_running_loop()
+    leaves = [view[i:i + HASH_LEAF_SIZE] for i in range(0, len(view), HASH_LEAF_SIZE)]
+    jobs = [loop.run_in_executor(None, _leaf_digest, leaf) for leaf in leaves]
+    try:
+        # Shielded: cancelling the digest must not cancel jobs mid-leaf
+        await asyncio.shield(asyncio.wait(jobs))
+    finally:
+        await asyncio.wait(jobs)
+        for leaf in leaves:
+            leaf.release()
+        view.release()
+    return data_digest(b"".join(job.result() for job in jobs))
+
+
+def json_dumps(obj) -> bytes:
+    """Encode an API response body, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
 
 
 class TransferStatus(Enum):
@@ -78,7 +143,18 @@ class TransferPriority(Enum):
     CRITICAL = 3  # Genesis Bond coordination traffic
 
 
-@dataclass
+# Request-side priority lookup by upper-case member name
+PRIORITY_BY_NAME: Dict[str, TransferPriority] = dict(TransferPriority.__members__)
+
+
+def parse_priority(name) -> Optional[TransferPriority]:
+    """Resolve a request priority name in any casing, or None if unknown."""
+    if not isinstance(name, str):
+        return None
+    return PRIORITY_BY_NAME.get(name.upper())
+
+
+@dataclass(slots=True)
 class TransferMetrics:
     """Metrics for a transfer operation."""
     bytes_transferred: int = 0
@@ -92,9 +168,7 @@ class TransferMetrics:
 
     @property
     def progress_percentage(self) -> float:
-        if self.bytes_total == 0:
-            return 0.0
-        return (self.bytes_transferred / self.bytes_total) * 100
+        return self.bytes_transferred * 100.0 / (self.bytes_total or 1)
 
     @property
     def elapsed_seconds(self) -> float:
@@ -104,7 +178,7 @@ class TransferMetrics:
         return end - self.start_time
 
 
-@dataclass
+@dataclass(slots=True)
 class TransferResult:
     """Result of a transfer operation."""
     transfer_id: str
@@ -116,7 +190,7 @@ class TransferResult:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TransferConfig:
     """Hercules transfer configuration."""
     # SCION
@@ -137,9 +211,39 @@ class TransferConfig:
     max_retries: int = 3
     retry_delay_seconds: float = 1.0
 
+    # Simulated link pacing (bench/test mode)
+    simulated_path_rate: float = SIMULATED_PATH_RATE
+    simulated_burst_bytes: int = 16 * CHUNK_SIZE
+
     # Server
     listen_port: int = HERCULES_PORT
     listen_addr: str = "0.0.0.0"
+    max_payload_bytes: int = 1024 * 1024 * 1024  # aiohttp client_max_size
+
+
+class PathPacer:
+    """
+    Token-bucket pacer for a single simulated SCION path.
+
+    Chunks draw tokens from the bucket and only sleep once the bucket
+    is in deficit, so the event loop timer heap is touched once per
+    starved interval rather than once per chunk.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+
+    async def acquire(self, nbytes: int):
+        """Reserve nbytes of path capacity, sleeping off any deficit."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+        self._tokens -= nbytes
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
 
 
 class PathAggregator:
@@ -185,30 +289,18 @@ class PathAggregator:
     async def _query_paths(self, dest_isd_as: str) -> List[str]:
         """Query available paths from SCION daemon."""
         # In production, would call scion showpaths
-        # Simulated paths with bandwidth estimates
-        return [
+        return list(self._make_paths(dest_isd_as))
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _make_paths(dest_isd_as: str) -> Tuple[str, ...]:
+        """Simulated paths with bandwidth estimates, cached per destination."""
+        return (
             f"path-high-bw-{dest_isd_as}",
             f"path-medium-bw-{dest_isd_as}",
             f"path-low-latency-{dest_isd_as}",
             f"path-backup-{dest_isd_as}",
-        ]
-
-    async def distribute_chunks(
-        self,
-        chunks: List[bytes],
-        paths: List[str],
-    ) -> List[Tuple[str, bytes]]:
-        """
-        Distribute chunks across paths for parallel transmission.
-
-        Uses round-robin distribution for simplicity. In production,
-        could use adaptive scheduling based on path performance.
-        """
-        assignments = []
-        for i, chunk in enumerate(chunks):
-            path = paths[i % len(paths)]
-            assignments.append((path, chunk))
-        return assignments
+        )
 
 
 class HerculesTransfer:
@@ -226,17 +318,21 @@ class HerculesTransfer:
         self.config = config
         self.aggregator = PathAggregator(config)
         self._running = False
+        self._stop_event = asyncio.Event()
         self._active_transfers: Dict[str, TransferResult] = {}
+        self._pacers: Dict[str, PathPacer] = {}
 
     async def start(self):
         """Start the Hercules transfer service."""
         self._running = True
+        self._stop_event.clear()
         logger.info(f"Hercules Transfer starting on port {self.config.listen_port}")
         await self._run_server()
 
     def stop(self):
         """Stop the service."""
         self._running = False
+        self._stop_event.set()
         logger.info("Hercules Transfer stopping")
 
     async def transfer_state(
@@ -306,6 +402,9 @@ class HerculesTransfer:
         # Split into chunks
         chunks = self._split_data(data)
 
+        # Fingerprint the payload in parallel with the transfer
+        digest_task = asyncio.ensure_future(tree_digest(data))
+
         # Distribute and transfer
         try:
             await self._transfer_chunks(chunks, paths, metrics)
@@ -313,7 +412,7 @@ class HerculesTransfer:
             metrics.end_time = time.time()
             metrics.throughput_mbps = self._calculate_throughput(metrics)
 
-            data_hash = hashlib.sha256(data).hexdigest()[:16]
+            data_hash = await digest_task
 
             result = TransferResult(
                 transfer_id=transfer_id,
@@ -343,52 +442,134 @@ class HerculesTransfer:
                 metrics=metrics,
                 error=str(e),
             )
+        finally:
+            # Release chunk views so mmap-backed payloads can be closed
+            for chunk in chunks:
+                chunk.release()
+            # A failed or cancelled transfer no longer needs the digest;
+            # tree_digest still waits out its running leaf jobs
+            digest_task.cancel()
+            await asyncio.wait((digest_task,))
+            if not digest_task.cancelled():
+                digest_task.exception()  # Retrieved here, never logged as lost
+
+    async def transfer_file(
+        self,
+        source: str,
+        dest: str,
+        file_path: Path,
+        priority: TransferPriority = TransferPriority.NORMAL,
+        coherence: float = 0.8,
+    ) -> TransferResult:
+        """
+        Transfer a disk-backed payload without reading it into memory.
+
+        The file is memory-mapped and chunked as memoryview slices, so
+        resident memory tracks the chunks in flight rather than the file
+        size. Once _send_chunk is backed by a real SCION socket, these
+        offsets map directly onto loop.sock_sendfile().
+
+        Args:
+            source: Source tier (CORE, COMN, PAC)
+            dest: Destination tier
+            file_path: File to transfer
+            priority: Transfer priority
+            coherence: Current coherence score
+
+        Returns:
+            TransferResult with operation details
+        """
+        with open(file_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return await self.transfer_state(source, dest, b"", priority, coherence)
+
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                return await self.transfer_state(source, dest, mm, priority, coherence)
+            finally:
+                mm.close()
 
     async def _transfer_chunks(
         self,
-        chunks: List[bytes],
+        chunks: List[memoryview],
         paths: List[str],
         metrics: TransferMetrics,
     ):
-        """Transfer chunks across multiple paths."""
-        assignments = await self.aggregator.distribute_chunks(chunks, paths)
+        """
+        Transfer chunks across multiple paths, retrying failures on alternate paths.
 
-        # Create tasks for parallel transfer
-        tasks = []
-        for path, chunk in assignments:
-            task = asyncio.create_task(self._send_chunk(path, chunk))
-            tasks.append(task)
+        Each path gets one worker that walks its round-robin stride of the
+        chunk list directly, so no (path, chunk) assignment list is built.
+        Failed chunks are queued onto the next path over for the retry round.
+        """
+        n = len(paths)
+        lanes: List[Iterable[memoryview]] = [
+            itertools.islice(chunks, i, None, n) for i in range(n)
+        ]
+
+        for attempt in range(self.config.max_retries + 1):
+            retry_lanes: List[List[memoryview]] = [[] for _ in range(n)]
+            errors: List[Exception] = []
+
+            await asyncio.gather(*(
+                self._send_lane(paths[i], lane, retry_lanes[(i + 1) % n], errors, metrics)
+                for i, lane in enumerate(lanes)
+            ))
 
-        # Execute with concurrency limit
-        for task in asyncio.as_completed(tasks):
+            if not errors:
+                return
+            if attempt == self.config.max_retries:
+                raise errors[0]
+
+            # Re-dispatch only the failed chunks, each on the next path over
+            metrics.retries += len(errors)
+            logger.warning(f"Retrying {len(errors)} chunks on alternate paths: {errors[0]}")
+            lanes = retry_lanes
+            await asyncio.sleep(self.config.retry_delay_seconds)
+
+    async def _send_lane(
+        self,
+        path: str,
+        lane: Iterable[memoryview],
+        retry_lane: List[memoryview],
+        errors: List[Exception],
+        metrics: TransferMetrics,
+    ):
+        """Send one path's share of chunks, collecting failures for retry."""
+        for chunk in lane:
             try:
-                bytes_sent = await task
-                metrics.bytes_transferred += bytes_sent
+                bytes_sent = await self._send_chunk(path, chunk)
             except Exception as e:
-                metrics.retries += 1
-                if metrics.retries > self.config.max_retries:
-                    raise
+                retry_lane.append(chunk)
+                errors.append(e)
+            else:
+                metrics.bytes_transferred += bytes_sent
 
     async def _send_chunk(self, path: str, chunk: bytes) -> int:
         """Send a single chunk via a SCION path."""
         # In production, would use SCION socket
-        # Simulate transfer
-        await asyncio.sleep(len(chunk) / (100 * 1024 * 1024))  # ~100MB/s per path
+        # Simulate transfer, paced per path by a token bucket
+        pacer = self._pacers.get(path)
+        if pacer is None:
+            pacer = self._pacers[path] = PathPacer(
+                self.config.simulated_path_rate,
+                self.config.simulated_burst_bytes,
+            )
+        await pacer.acquire(len(chunk))
         return len(chunk)
 
-    def _split_data(self, data: bytes) -> List[bytes]:
-        """Split data into chunks."""
-        chunks = []
-        for i in range(0, len(data), self.config.chunk_size):
-            chunks.append(data[i:i + self.config.chunk_size])
-        return chunks
+    def _split_data(self, data: bytes) -> List[memoryview]:
+        """Split data into zero-copy chunk views."""
+        view = memoryview(data)
+        size = self.config.chunk_size
+        return [view[i:i + size] for i in range(0, len(view), size)]
 
     def _calculate_throughput(self, metrics: TransferMetrics) -> float:
         """Calculate throughput in Mbps."""
-        if metrics.elapsed_seconds <= 0:
+        elapsed = metrics.elapsed_seconds
+        if elapsed <= 0:
             return 0.0
-        bytes_per_second = metrics.bytes_transferred / metrics.elapsed_seconds
-        return (bytes_per_second * 8) / (1024 * 1024)  # Convert to Mbps
+        return metrics.bytes_transferred * MBPS_SCALE / elapsed
 
     def _generate_transfer_id(self) -> str:
         """Generate unique transfer ID."""
@@ -399,23 +580,15 @@ class HerculesTransfer:
         try:
             from aiohttp import web
 
-            async def transfer_handler(request):
-                data = await request.json()
-                source = data.get("source", "COMN")
-                dest = data.get("dest", "CORE")
-                payload = data.get("data", "").encode()
-                coherence = float(data.get("coherence", "0.8"))
-                priority = TransferPriority[data.get("priority", "NORMAL").upper()]
-
-                result = await self.transfer_state(
-                    source=source,
-                    dest=dest,
-                    data=payload,
-                    priority=priority,
-                    coherence=coherence,
+            def json_response(obj, status: int = 200):
+                return web.Response(
+                    body=json_dumps(obj),
+                    status=status,
+                    content_type="application/json",
                 )
 
-                return web.json_response({
+            def transfer_response(result: TransferResult):
+                return json_response({
                     "transfer_id": result.transfer_id,
                     "status": result.status.value,
                     "source_tier": result.source_tier,
@@ -431,26 +604,71 @@ class HerculesTransfer:
                     "error": result.error,
                 })
 
+            def unknown_priority_response(name):
+                return json_response({"error": f"Unknown priority: {name}"}, status=400)
+
+            async def transfer_handler(request):
+                data = await request.json()
+                source = data.get("source", "COMN")
+                dest = data.get("dest", "CORE")
+                payload = data.get("data", "").encode()
+                coherence = float(data.get("coherence", "0.8"))
+                priority_name = data.get("priority", "NORMAL")
+                priority = parse_priority(priority_name)
+                if priority is None:
+                    return unknown_priority_response(priority_name)
+
+                result = await self.transfer_state(
+                    source=source,
+                    dest=dest,
+                    data=payload,
+                    priority=priority,
+                    coherence=coherence,
+                )
+                return transfer_response(result)
+
+            async def binary_transfer_handler(request):
+                # Raw application/octet-stream body; metadata rides in headers
+                headers = request.headers
+                source = headers.get("X-Hercules-Source", "COMN")
+                dest = headers.get("X-Hercules-Dest", "CORE")
+                coherence = float(headers.get("X-Hercules-Coherence", "0.8"))
+                priority_name = headers.get("X-Hercules-Priority", "NORMAL")
+                priority = parse_priority(priority_name)
+                if priority is None:
+                    return unknown_priority_response(priority_name)
+                payload = await request.read()
+
+                result = await self.transfer_state(
+                    source=source,
+                    dest=dest,
+                    data=payload,
+                    priority=priority,
+                    coherence=coherence,
+                )
+                return transfer_response(result)
+
             async def status_handler(request):
                 transfer_id = request.match_info["id"]
                 if transfer_id in self._active_transfers:
                     result = self._active_transfers[transfer_id]
-                    return web.json_response({
+                    return json_response({
                         "transfer_id": result.transfer_id,
                         "status": result.status.value,
                         "progress": result.metrics.progress_percentage,
                     })
-                return web.json_response({"error": "Transfer not found"}, status=404)
+                return json_response({"error": "Transfer not found"}, status=404)
 
             async def health_handler(request):
-                return web.json_response({
+                return json_response({
                     "status": "healthy",
                     "genesis_bond": GENESIS_BOND_ID,
                     "active_transfers": len(self._active_transfers),
                 })
 
-            app = web.Application()
+            app = web.Application(client_max_size=self.config.max_payload_bytes)
             app.router.add_post("/transfer", transfer_handler)
+            app.router.add_post("/transfer/binary", binary_transfer_handler)
             app.router.add_get("/status/{id}", status_handler)
             app.router.add_get("/health", health_handler)
 
@@ -461,8 +679,8 @@ class HerculesTransfer:
 
             logger.info(f"Hercules API at :{self.config.listen_port}")
 
-            while self._running:
-                await asyncio.sleep(1)
+            await self._stop_event.wait()
+            await runner.cleanup()
 
         except ImportError:
             logger.error("aiohttp not available")
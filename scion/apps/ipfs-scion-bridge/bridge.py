@@ -30,12 +30,15 @@ import hashlib
 import json
 import logging
 import os
+import re
 import sys
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import Enum, IntEnum
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Any
 
 # Add lib to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "lib"))
@@ -59,6 +62,22 @@ except ImportError:
     # Fallback for testing
     TIER_ISD_AS = {"CORE": "1-ff00:0:432", "COMN": "2-ff00:0:528", "PAC": "3-ff00:0:741"}
     TIER_FREQUENCIES = {"CORE": 432, "COMN": 528, "PAC": 741}
+    get_policy_for_tier = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    import redis.asyncio as redis_asyncio
+except ImportError:
+    redis_asyncio = None
 
 # Logging
 logging.basicConfig(level=logging.INFO)
@@ -68,13 +87,47 @@ logger = logging.getLogger("ipfs-scion-bridge")
 GENESIS_BOND_ID = "GB-2025-0524-DRH-LCS-001"
 IPFS_API_PORT = 5001
 BRIDGE_PORT = 51001
+CONTENT_CHUNK_SIZE = 64 * 1024  # /get streaming chunk size
+AUDIT_QUEUE_SIZE = 4096
+AUDIT_BATCH_SIZE = 32
+AUDIT_FLUSH_INTERVAL = 0.1  # seconds
+
+
+def json_dumps(obj) -> bytes:
+    """Encode an API response body, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def json_loads(body: bytes):
+    """Decode an API request body, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+class ContentTier(IntEnum):
+    """Content classification tiers (values index the per-tier tables below)."""
+    CORE = 0      # Infrastructure, agent state
+    COMN = 1      # Shared knowledge, communication
+    PAC = 2       # Personal data (CBB-owned)
+
+
+# Wire names for serialization, indexed by ContentTier
+TIER_NAMES: Tuple[str, ...] = ("core", "comn", "pac")
+
+# Request-side tier lookup by wire name ("core", "comn", "pac")
+CONTENT_TIER_BY_NAME: Dict[str, ContentTier] = {TIER_NAMES[t]: t for t in ContentTier}
 
+# Per-tier lookups indexed by ContentTier
+CONTENT_TIER_ISD_AS: Tuple[str, ...] = (
+    TIER_ISD_AS["CORE"],
+    TIER_ISD_AS["COMN"],
+    TIER_ISD_AS["PAC"],
+)
 
-class ContentTier(Enum):
-    """Content classification tiers."""
-    CORE = "core"      # Infrastructure, agent state
-    COMN = "comn"      # Shared knowledge, communication
-    PAC = "pac"        # Personal data (CBB-owned)
+COHERENCE_THRESHOLDS: Tuple[float, ...] = (0.85, 0.80, 0.70)
 
 
 class PinStatus(Enum):
@@ -85,7 +138,7 @@ class PinStatus(Enum):
     UNAUTHORIZED = "unauthorized"
 
 
-@dataclass
+@dataclass(slots=True)
 class ContentMetadata:
     """Metadata for IPFS content."""
     cid: str
@@ -101,7 +154,7 @@ class ContentMetadata:
     def to_dict(self) -> dict:
         return {
             "cid": self.cid,
-            "tier": self.tier.value,
+            "tier": TIER_NAMES[self.tier],
             "size_bytes": self.size_bytes,
             "mime_type": self.mime_type,
             "owner_did": self.owner_did,
@@ -112,7 +165,7 @@ class ContentMetadata:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PinResult:
     """Result of a pin operation."""
     cid: str
@@ -121,15 +174,18 @@ class PinResult:
     path_used: str = ""
     coherence: float = 0.0
     error: Optional[str] = None
-    timestamp: float = field(default_factory=time.time)
+    timestamp: int = field(default_factory=time.monotonic_ns)  # Monotonic, for correlation
 
 
-@dataclass
+@dataclass(slots=True)
 class BridgeConfig:
     """Bridge configuration."""
     # IPFS
     ipfs_api: str = "http://localhost:5001"
     ipfs_gateway: str = "https://s8m.io"
+    ipfs_pool_limit: int = 64
+    ipfs_pool_limit_per_host: int = 32  # IPFS pins best at 10-20 concurrent
+    ipfs_timeout_seconds: float = 30.0
 
     # SCION
     scion_daemon: str = "localhost:30255"
@@ -142,11 +198,32 @@ class BridgeConfig:
     # Path selection
     prefer_privacy: bool = True  # PAC content uses privacy-optimized paths
     coherence_threshold: float = 0.7
+    path_cache_size: int = 1024
+    path_cache_ttl: float = 30.0  # seconds before cached paths are re-queried
+    redis_url: Optional[str] = None  # e.g. redis://localhost:6379/0, shared L2 path cache
 
     # PAC handling
     pac_requires_consent: bool = True
     pac_audit_enabled: bool = True
 
+    # Batch pinning
+    pin_batch_concurrency: int = 8  # 2-3 for a remote IPFS API
+
+
+# Path classification: one regex pass per path yields a bitmask of tokens
+PATH_VIA_COMN = 1
+PATH_DIRECT = 2
+PATH_VIA_CORE = 4
+_PATH_TOKENS = re.compile(r"(comn)|(direct)|(core)", re.IGNORECASE)
+
+
+def classify_path(path: str) -> int:
+    """Return the PATH_* flags for the tokens present in a path."""
+    flags = 0
+    for match in _PATH_TOKENS.finditer(path):
+        flags |= 1 << (match.lastindex - 1)
+    return flags
+
 
 class SCIONPathSelector:
     """
@@ -160,7 +237,20 @@ class SCIONPathSelector:
 
     def __init__(self, config: BridgeConfig):
         self.config = config
-        self._path_cache: Dict[str, List[str]] = {}
+        # Bounded LRU of (tier, dest_isd_as) -> (monotonic insert time, paths)
+        self._path_cache: "OrderedDict[Tuple[ContentTier, str], Tuple[float, List[str]]]" = OrderedDict()
+        # Optional Redis second-level cache shared across bridge replicas
+        self._redis = None
+        if config.redis_url:
+            if redis_asyncio is None:
+                logger.warning("redis not available, shared path cache disabled")
+            else:
+                self._redis = redis_asyncio.from_url(config.redis_url)
+        # Consciousness path policy per tier, resolved once
+        self._policies: Dict[ContentTier, Any] = {
+            tier: get_policy_for_tier(TIER_NAMES[tier]) if get_policy_for_tier else None
+            for tier in ContentTier
+        }
 
     async def get_paths_for_tier(self, tier: ContentTier, dest_isd_as: str) -> List[str]:
         """
@@ -168,33 +258,82 @@ class SCIONPathSelector:
 
         Returns paths sorted by preference based on tier policy.
         """
-        cache_key = f"{tier.value}:{dest_isd_as}"
-
-        if cache_key in self._path_cache:
-            return self._path_cache[cache_key]
+        cache_key = (tier, dest_isd_as)
+
+        cached = self._path_cache.get(cache_key)
+        if cached is not None:
+            cached_at, cached_paths = cached
+            if time.monotonic() - cached_at < self.config.path_cache_ttl:
+                self._path_cache.move_to_end(cache_key)
+                return cached_paths
+            del self._path_cache[cache_key]
+
+        # Warm tier: path selections shared across bridge replicas
+        paths = await self._shared_cache_get(tier, dest_isd_as)
+        if paths is None:
+            paths = await self._select_paths(tier, dest_isd_as)
+            await self._shared_cache_set(tier, dest_isd_as, paths)
+
+        self._path_cache[cache_key] = (time.monotonic(), paths)
+        if len(self._path_cache) > self.config.path_cache_size:
+            self._path_cache.popitem(last=False)
+        return paths
 
+    async def _select_paths(self, tier: ContentTier, dest_isd_as: str) -> List[str]:
+        """Query the SCION daemon and order paths by tier policy."""
         # Get policy for tier
-        policy = get_policy_for_tier(tier.value.upper()) if 'get_policy_for_tier' in dir() else None
+        policy = self._policies[tier]
 
         paths = await self._query_paths(dest_isd_as)
 
-        # Filter and sort paths based on policy
+        # Classify each path once; scorers take the PATH_* flags
+        flags = [classify_path(p) for p in paths]
+
+        # Filter and sort paths based on policy, scoring each path once
         if tier == ContentTier.PAC:
-            # PAC: Require COMN waypoint
-            paths = [p for p in paths if self._has_waypoint(p, TIER_ISD_AS["COMN"])]
-            # Prefer privacy-optimized paths
-            paths = sorted(paths, key=lambda p: self._privacy_score(p), reverse=True)
+            # PAC: Require COMN waypoint, prefer privacy-optimized paths
+            scored = [
+                (self._privacy_score(f), p)
+                for f, p in zip(flags, paths)
+                if self._has_waypoint(f, TIER_ISD_AS["COMN"])
+            ]
+            scored.sort(key=itemgetter(0), reverse=True)
 
         elif tier == ContentTier.CORE:
             # CORE: Prefer latency-optimized paths
-            paths = sorted(paths, key=lambda p: self._latency_score(p))
+            scored = [(self._latency_score(f), p) for f, p in zip(flags, paths)]
+            scored.sort(key=itemgetter(0))
 
         else:
             # COMN: Balanced
-            paths = sorted(paths, key=lambda p: self._balanced_score(p))
+            scored = [(self._balanced_score(f), p) for f, p in zip(flags, paths)]
+            scored.sort(key=itemgetter(0))
 
-        self._path_cache[cache_key] = paths
-        return paths
+        return [p for _, p in scored]
+
+    async def _shared_cache_get(self, tier: ContentTier, dest_isd_as: str) -> Optional[List[str]]:
+        """Look up a path selection in Redis, if configured."""
+        if self._redis is None:
+            return None
+        try:
+            raw = await self._redis.get(f"scion:paths:{TIER_NAMES[tier]}:{dest_isd_as}")
+        except Exception as e:
+            logger.warning("Redis path cache get failed: %s", e)
+            return None
+        return json_loads(raw) if raw is not None else None
+
+    async def _shared_cache_set(self, tier: ContentTier, dest_isd_as: str, paths: List[str]):
+        """Store a path selection in Redis with the path cache TTL, if configured."""
+        if self._redis is None:
+            return
+        try:
+            await self._redis.setex(
+                f"scion:paths:{TIER_NAMES[tier]}:{dest_isd_as}",
+                max(1, int(self.config.path_cache_ttl)),
+                json_dumps(paths),
+            )
+        except Exception as e:
+            logger.warning("Redis path cache set failed: %s", e)
 
     async def _query_paths(self, dest_isd_as: str) -> List[str]:
         """Query available paths from SCION daemon."""
@@ -205,28 +344,34 @@ class SCIONPathSelector:
             f"path-direct-{dest_isd_as}",
         ]
 
-    def _has_waypoint(self, path: str, waypoint_isd_as: str) -> bool:
-        """Check if path traverses required waypoint."""
+    async def close(self):
+        """Close the Redis client."""
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+    def _has_waypoint(self, flags: int, waypoint_isd_as: str) -> bool:
+        """Check if a classified path traverses required waypoint."""
         # In production, would inspect path segments
-        return "comn" in path.lower()
+        return bool(flags & PATH_VIA_COMN)
 
-    def _privacy_score(self, path: str) -> float:
-        """Score path for privacy (higher is better)."""
+    def _privacy_score(self, flags: int) -> float:
+        """Score a classified path for privacy (higher is better)."""
         score = 0.5
-        if "comn" in path.lower():
+        if flags & PATH_VIA_COMN:
             score += 0.3  # Prefer COMN waypoint
-        if "direct" in path.lower():
+        if flags & PATH_DIRECT:
             score -= 0.2  # Penalize direct paths for PAC
         return score
 
-    def _latency_score(self, path: str) -> float:
-        """Score path for latency (lower is better)."""
+    def _latency_score(self, flags: int) -> float:
+        """Score a classified path for latency (lower is better)."""
         score = 0.5
-        if "direct" in path.lower():
+        if flags & PATH_DIRECT:
             score -= 0.3  # Prefer direct paths
         return score
 
-    def _balanced_score(self, path: str) -> float:
+    def _balanced_score(self, flags: int) -> float:
         """Balanced scoring."""
         return 0.5
 
@@ -246,20 +391,64 @@ class IPFSSCIONBridge:
         self.config = config
         self.path_selector = SCIONPathSelector(config)
         self._running = False
+        self._stop_event = asyncio.Event()
+        self._ipfs_session = None  # Pooled aiohttp.ClientSession, set in start()
+        self._audit_q: asyncio.Queue = asyncio.Queue(maxsize=AUDIT_QUEUE_SIZE)
+        self._audit_task: Optional[asyncio.Task] = None
+        # IPFS pin calls currently in flight, keyed by (cid, tier);
+        # each future resolves to whether its owner completed the pin
+        self._inflight: Dict[Tuple[str, ContentTier], "asyncio.Future[bool]"] = {}
 
     async def start(self):
         """Start the IPFS-SCION bridge."""
         self._running = True
-        logger.info(f"IPFS-SCION Bridge starting on port {self.config.listen_port}")
+        self._stop_event.clear()
+        logger.info("IPFS-SCION Bridge starting on port %d", self.config.listen_port)
+
+        # One pooled session for all IPFS API calls
+        try:
+            import aiohttp
+
+            connector = aiohttp.TCPConnector(
+                limit=self.config.ipfs_pool_limit,
+                limit_per_host=self.config.ipfs_pool_limit_per_host,
+                keepalive_timeout=60,
+                enable_cleanup_closed=True,
+            )
+            self._ipfs_session = aiohttp.ClientSession(
+                base_url=self.config.ipfs_api,
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.config.ipfs_timeout_seconds),
+            )
+        except ImportError:
+            logger.warning("aiohttp not available, IPFS operations simulated")
+
+        # Ship PAC audit events off the pin path
+        self._audit_task = asyncio.create_task(self._audit_worker())
 
         # Start HTTP server
         await self._run_server()
 
-    def stop(self):
+    async def stop(self):
         """Stop the bridge."""
         self._running = False
+        self._stop_event.set()
         logger.info("IPFS-SCION Bridge stopping")
 
+        if self._audit_task is not None:
+            self._audit_task.cancel()
+            try:
+                await self._audit_task
+            except asyncio.CancelledError:
+                pass
+            self._audit_task = None
+
+        if self._ipfs_session is not None:
+            await self._ipfs_session.close()
+            self._ipfs_session = None
+
+        await self.path_selector.close()
+
     async def pin_via_scion(
         self,
         cid: str,
@@ -279,54 +468,137 @@ class IPFSSCIONBridge:
         Returns:
             PinResult with operation status
         """
-        logger.info(f"Pin request: CID={cid}, tier={tier.value}, coherence={coherence}")
+        logger.info("Pin request: CID=%s, tier=%s, coherence=%.3f", cid, TIER_NAMES[tier], coherence)
 
-        # Validate coherence
-        if not self._validate_coherence(tier, coherence):
+        selected_path, status, error = await self._select_pin_path(tier, metadata, coherence)
+        if selected_path is None:
             return PinResult(
                 cid=cid,
-                status=PinStatus.UNAUTHORIZED,
+                status=status,
                 tier=tier,
                 coherence=coherence,
-                error=f"Coherence {coherence} below threshold for {tier.value} tier",
+                error=error,
             )
 
-        # PAC tier: Check consent
-        if tier == ContentTier.PAC and self.config.pac_requires_consent:
-            if metadata and metadata.requires_consent:
-                consent_valid = await self._validate_pac_consent(metadata)
-                if not consent_valid:
-                    return PinResult(
-                        cid=cid,
-                        status=PinStatus.UNAUTHORIZED,
-                        tier=tier,
-                        coherence=coherence,
-                        error="PAC consent not granted",
-                    )
+        return await self._pin_on_path(
+            cid, tier, selected_path, metadata, coherence, time.monotonic_ns(), time.time()
+        )
 
-        # Get SCION path
-        dest_isd_as = TIER_ISD_AS.get(tier.value.upper(), TIER_ISD_AS["COMN"])
-        paths = await self.path_selector.get_paths_for_tier(tier, dest_isd_as)
+    async def pin_many_via_scion(
+        self,
+        cids: List[str],
+        tier: ContentTier,
+        metadata: Optional[ContentMetadata] = None,
+        coherence: float = 0.8,
+    ) -> List[PinResult]:
+        """
+        Pin a batch of CIDs of one tier via a single SCION path lookup.
 
-        if not paths:
-            return PinResult(
-                cid=cid,
-                status=PinStatus.FAILED,
-                tier=tier,
-                coherence=coherence,
-                error="No SCION paths available",
+        Coherence, consent and path selection run once for the batch;
+        the pins themselves overlap, bounded by pin_batch_concurrency.
+
+        Args:
+            cids: IPFS content identifiers
+            tier: Content tier shared by all CIDs
+            metadata: Optional content metadata shared by all CIDs
+            coherence: Current coherence score
+
+        Returns:
+            PinResult per CID, in input order
+        """
+        logger.info(
+            "Batch pin request: %d CIDs, tier=%s, coherence=%.3f", len(cids), TIER_NAMES[tier], coherence
+        )
+
+        # One timestamp pair shared by every result and audit event in the batch
+        now_ns = time.monotonic_ns()
+        now = time.time()
+
+        selected_path, status, error = await self._select_pin_path(tier, metadata, coherence)
+        if selected_path is None:
+            return [
+                PinResult(
+                    cid=cid, status=status, tier=tier, coherence=coherence, error=error, timestamp=now_ns
+                )
+                for cid in cids
+            ]
+
+        semaphore = asyncio.Semaphore(self.config.pin_batch_concurrency)
+
+        async def pin_one(cid: str) -> PinResult:
+            async with semaphore:
+                return await self._pin_on_path(cid, tier, selected_path, metadata, coherence, now_ns, now)
+
+        return await asyncio.gather(*(pin_one(cid) for cid in cids))
+
+    async def _select_pin_path(
+        self,
+        tier: ContentTier,
+        metadata: Optional[ContentMetadata],
+        coherence: float,
+    ) -> Tuple[Optional[str], PinStatus, Optional[str]]:
+        """
+        Run pin preflight checks and select the SCION path.
+
+        Returns:
+            (path, PENDING, None) if the pin may proceed,
+            otherwise (None, status, error)
+        """
+        # Validate coherence
+        if not self._validate_coherence(tier, coherence):
+            return (
+                None,
+                PinStatus.UNAUTHORIZED,
+                f"Coherence {coherence} below threshold for {TIER_NAMES[tier]} tier",
             )
 
+        dest_isd_as = CONTENT_TIER_ISD_AS[tier]
+
+        # PAC tier: Check consent alongside the (independent) path query
+        if (
+            tier == ContentTier.PAC
+            and self.config.pac_requires_consent
+            and metadata
+            and metadata.requires_consent
+        ):
+            consent_valid, paths = await asyncio.gather(
+                self._validate_pac_consent(metadata),
+                self.path_selector.get_paths_for_tier(tier, dest_isd_as),
+            )
+            if not consent_valid:
+                return None, PinStatus.UNAUTHORIZED, "PAC consent not granted"
+        else:
+            # Get SCION path
+            paths = await self.path_selector.get_paths_for_tier(tier, dest_isd_as)
+
+        if not paths:
+            return None, PinStatus.FAILED, "No SCION paths available"
+
         # Use first (best) path
-        selected_path = paths[0]
+        return paths[0], PinStatus.PENDING, None
+
+    async def _pin_on_path(
+        self,
+        cid: str,
+        tier: ContentTier,
+        selected_path: str,
+        metadata: Optional[ContentMetadata],
+        coherence: float,
+        now_ns: int,
+        now: float,
+    ) -> PinResult:
+        """
+        Pin a single CID on an already-selected path.
 
-        # Perform pin operation
+        now_ns stamps the PinResult (monotonic) and now stamps the PAC
+        audit event (wall clock); batches pass the same pair for every CID.
+        """
         try:
-            await self._pin_content(cid, selected_path, tier)
+            await self._pin_content_shared(cid, selected_path, tier)
 
             # Audit PAC operations
             if tier == ContentTier.PAC and self.config.pac_audit_enabled:
-                await self._audit_pac_pin(cid, metadata, selected_path)
+                self._audit_pac_pin(cid, metadata, selected_path, now)
 
             return PinResult(
                 cid=cid,
@@ -334,16 +606,18 @@ class IPFSSCIONBridge:
                 tier=tier,
                 path_used=selected_path,
                 coherence=coherence,
+                timestamp=now_ns,
             )
 
         except Exception as e:
-            logger.error(f"Pin failed: {e}")
+            logger.error("Pin failed: %s", e)
             return PinResult(
                 cid=cid,
                 status=PinStatus.FAILED,
                 tier=tier,
                 coherence=coherence,
                 error=str(e),
+                timestamp=now_ns,
             )
 
     async def get_via_scion(
@@ -363,31 +637,51 @@ class IPFSSCIONBridge:
         Returns:
             Tuple of (content_bytes, error_message)
         """
+        chunks, error = await self.stream_via_scion(cid, tier, coherence)
+        if error:
+            return None, error
+
+        try:
+            return b"".join([chunk async for chunk in chunks]), None
+        except Exception as e:
+            return None, str(e)
+
+    async def stream_via_scion(
+        self,
+        cid: str,
+        tier: ContentTier,
+        coherence: float = 0.8,
+    ) -> Tuple[Optional[AsyncIterator[bytes]], Optional[str]]:
+        """
+        Retrieve content via SCION path as a stream of chunks.
+
+        Coherence and path selection run up front; content is then pulled
+        from IPFS chunk by chunk as the returned iterator is consumed.
+
+        Args:
+            cid: IPFS content identifier
+            tier: Expected content tier
+            coherence: Current coherence score
+
+        Returns:
+            Tuple of (chunk_iterator, error_message)
+        """
         # Validate coherence
         if not self._validate_coherence(tier, coherence):
             return None, f"Coherence {coherence} below threshold"
 
         # Get SCION path
-        dest_isd_as = TIER_ISD_AS.get(tier.value.upper(), TIER_ISD_AS["COMN"])
+        dest_isd_as = CONTENT_TIER_ISD_AS[tier]
         paths = await self.path_selector.get_paths_for_tier(tier, dest_isd_as)
 
         if not paths:
             return None, "No SCION paths available"
 
-        try:
-            content = await self._fetch_content(cid, paths[0])
-            return content, None
-        except Exception as e:
-            return None, str(e)
+        return self._fetch_content(cid, paths[0]), None
 
     def _validate_coherence(self, tier: ContentTier, coherence: float) -> bool:
         """Validate coherence meets tier requirements."""
-        thresholds = {
-            ContentTier.CORE: 0.85,
-            ContentTier.COMN: 0.80,
-            ContentTier.PAC: 0.70,
-        }
-        return coherence >= thresholds.get(tier, 0.7)
+        return coherence >= COHERENCE_THRESHOLDS[tier]
 
     async def _validate_pac_consent(self, metadata: ContentMetadata) -> bool:
         """Validate PAC consent for content."""
@@ -397,71 +691,202 @@ class IPFSSCIONBridge:
 
     async def _pin_content(self, cid: str, path: str, tier: ContentTier):
         """Pin content to IPFS via SCION path."""
-        # In production, would use IPFS HTTP API via SCION
-        logger.debug(f"Pinning {cid} via path {path}")
-        await asyncio.sleep(0.1)  # Simulate pin operation
-
-    async def _fetch_content(self, cid: str, path: str) -> bytes:
-        """Fetch content from IPFS via SCION path."""
-        # In production, would use IPFS HTTP API via SCION
-        logger.debug(f"Fetching {cid} via path {path}")
-        await asyncio.sleep(0.1)
-        return b""  # Placeholder
-
-    async def _audit_pac_pin(
+        logger.debug("Pinning %s via path %s", cid, path)
+        if self._ipfs_session is None:
+            await asyncio.sleep(0.1)  # Simulate pin operation
+            return
+
+        async with self._ipfs_session.post("/api/v0/pin/add", params={"arg": cid}) as resp:
+            resp.raise_for_status()
+
+    async def _pin_content_shared(self, cid: str, path: str, tier: ContentTier):
+        """
+        Pin content, joining an identical IPFS pin already in flight.
+
+        Only the IPFS call is shared: every caller has already passed its
+        own coherence and consent checks, and builds its own PinResult.
+        The shared future resolves to True once the owner has pinned, or to
+        False if the owner was cancelled, in which case a joiner takes over
+        the pin instead of inheriting a cancellation it never asked for.
+        """
+        key = (cid, tier)
+        while True:
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                break
+            if await asyncio.shield(inflight):
+                return
+
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        try:
+            await self._pin_content(cid, path, tier)
+        except asyncio.CancelledError:
+            fut.set_result(False)
+            raise
+        except Exception as e:
+            fut.set_exception(e)
+            fut.exception()  # Retrieved here; joiners still receive it
+            raise
+        else:
+            fut.set_result(True)
+        finally:
+            del self._inflight[key]
+
+    async def _fetch_content(self, cid: str, path: str) -> AsyncIterator[bytes]:
+        """Stream content from IPFS via SCION path."""
+        logger.debug("Fetching %s via path %s", cid, path)
+        if self._ipfs_session is None:
+            await asyncio.sleep(0.1)
+            return  # Placeholder: no content
+
+        async with self._ipfs_session.post("/api/v0/cat", params={"arg": cid}) as resp:
+            resp.raise_for_status()
+            async for chunk in resp.content.iter_chunked(CONTENT_CHUNK_SIZE):
+                yield chunk
+
+    def _audit_pac_pin(
         self,
         cid: str,
         metadata: Optional[ContentMetadata],
         path: str,
+        now: float,
     ):
-        """Send audit event for PAC pin operation."""
+        """Queue audit event for PAC pin operation."""
         audit_event = {
             "type": "pac_ipfs_pin",
             "cid": cid,
             "path": path,
-            "timestamp": time.time(),
+            "timestamp": now,
             "genesis_bond": GENESIS_BOND_ID,
         }
         if metadata:
             audit_event["owner_did"] = metadata.owner_did
 
-        logger.debug(f"PAC audit: {audit_event}")
+        if self._audit_task is None:
+            # Bridge not started: no worker to drain the queue
+            self._flush_audit_events([audit_event])
+            return
+
+        try:
+            self._audit_q.put_nowait(audit_event)
+        except asyncio.QueueFull:
+            logger.warning("PAC audit queue full, dropping event for %s", cid)
+
+    async def _audit_worker(self):
+        """Drain the audit queue in batches of AUDIT_BATCH_SIZE or AUDIT_FLUSH_INTERVAL."""
+        loop = asyncio.get_running_loop()
+        batch: List[dict] = []
+        try:
+            while True:
+                batch.append(await self._audit_q.get())
+                deadline = loop.time() + AUDIT_FLUSH_INTERVAL
+
+                while len(batch) < AUDIT_BATCH_SIZE:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._audit_q.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                self._flush_audit_events(batch)
+                batch = []
+        finally:
+            # Flush anything still pending when cancelled at shutdown
+            while not self._audit_q.empty():
+                batch.append(self._audit_q.get_nowait())
+            if batch:
+                self._flush_audit_events(batch)
+
+    def _flush_audit_events(self, events: List[dict]):
+        """Send a batch of PAC audit events to the audit sink."""
+        for audit_event in events:
+            logger.debug("PAC audit: %s", audit_event)
 
     async def _run_server(self):
         """Run HTTP server for bridge API."""
         try:
             from aiohttp import web
 
-            async def pin_handler(request):
-                data = await request.json()
-                cid = data.get("cid")
-                tier = ContentTier(data.get("tier", "comn"))
-                coherence = data.get("coherence", 0.8)
+            def json_response(obj, status: int = 200):
+                return web.Response(
+                    body=json_dumps(obj),
+                    status=status,
+                    content_type="application/json",
+                )
 
-                result = await self.pin_via_scion(cid, tier, coherence=coherence)
+            def unknown_tier_response(name):
+                return json_response({"error": f"Unknown tier: {name}"}, status=400)
 
-                return web.json_response({
+            def pin_result_dict(result: PinResult) -> dict:
+                return {
                     "cid": result.cid,
                     "status": result.status.value,
-                    "tier": result.tier.value,
+                    "tier": TIER_NAMES[result.tier],
                     "path": result.path_used,
                     "error": result.error,
+                }
+
+            async def pin_handler(request):
+                data = json_loads(await request.read())
+                cid = data.get("cid")
+                tier_name = data.get("tier", "comn")
+                tier = CONTENT_TIER_BY_NAME.get(tier_name) if isinstance(tier_name, str) else None
+                if tier is None:
+                    return unknown_tier_response(tier_name)
+                coherence = data.get("coherence", 0.8)
+
+                result = await self.pin_via_scion(cid, tier, coherence=coherence)
+
+                return json_response(pin_result_dict(result))
+
+            async def batch_pin_handler(request):
+                data = json_loads(await request.read())
+                cids = data.get("cids", [])
+                tier_name = data.get("tier", "comn")
+                tier = CONTENT_TIER_BY_NAME.get(tier_name) if isinstance(tier_name, str) else None
+                if tier is None:
+                    return unknown_tier_response(tier_name)
+                coherence = data.get("coherence", 0.8)
+
+                results = await self.pin_many_via_scion(cids, tier, coherence=coherence)
+
+                return json_response({
+                    "results": [pin_result_dict(result) for result in results],
                 })
 
             async def get_handler(request):
                 cid = request.match_info["cid"]
-                tier = ContentTier(request.query.get("tier", "comn"))
+                tier_name = request.query.get("tier", "comn")
+                tier = CONTENT_TIER_BY_NAME.get(tier_name)
+                if tier is None:
+                    return unknown_tier_response(tier_name)
                 coherence = float(request.query.get("coherence", "0.8"))
 
-                content, error = await self.get_via_scion(cid, tier, coherence)
+                chunks, error = await self.stream_via_scion(cid, tier, coherence)
 
                 if error:
-                    return web.json_response({"error": error}, status=400)
-
-                return web.Response(body=content or b"")
+                    return json_response({"error": error}, status=400)
+
+                # Pull the first chunk before committing to a 200 response
+                try:
+                    first = await anext(chunks, b"")
+                except Exception as e:
+                    return json_response({"error": str(e)}, status=400)
+
+                response = web.StreamResponse()
+                await response.prepare(request)
+                if first:
+                    await response.write(first)
+                async for chunk in chunks:
+                    await response.write(chunk)
+                await response.write_eof()
+                return response
 
             async def health_handler(request):
-                return web.json_response({
+                return json_response({
                     "status": "healthy",
                     "genesis_bond": GENESIS_BOND_ID,
                     "local_isd_as": self.config.local_isd_as,
@@ -469,6 +894,7 @@ class IPFSSCIONBridge:
 
             app = web.Application()
             app.router.add_post("/pin", pin_handler)
+            app.router.add_post("/pin/batch", batch_pin_handler)
             app.router.add_get("/get/{cid}", get_handler)
             app.router.add_get("/health", health_handler)
 
@@ -477,10 +903,10 @@ class IPFSSCIONBridge:
             site = web.TCPSite(runner, self.config.listen_addr, self.config.listen_port)
             await site.start()
 
-            logger.info(f"IPFS-SCION Bridge API at :{self.config.listen_port}")
+            logger.info("IPFS-SCION Bridge API at :%d", self.config.listen_port)
 
-            while self._running:
-                await asyncio.sleep(1)
+            await self._stop_event.wait()
+            await runner.cleanup()
 
         except ImportError:
             logger.error("aiohttp not available")
@@ -494,8 +920,11 @@ async def main():
     try:
         await bridge.start()
     except KeyboardInterrupt:
-        bridge.stop()
+        await bridge.stop()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -21,7 +21,10 @@ Metrics Exposed:
 """
 
 import asyncio
+import itertools
+import json
 import logging
+import random
 import socket
 import struct
 import time
@@ -46,6 +49,16 @@ except ImportError:
     TIER_FREQUENCIES = {"CORE": 432, "COMN": 528, "PAC": 741}
     TIER_COHERENCE = {"CORE": 0.85, "COMN": 0.80, "PAC": 0.70}
 
+try:
+    from aiohttp import web
+except ImportError:
+    web = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("consciousness-heartbeat")
@@ -53,6 +66,57 @@ logger = logging.getLogger("consciousness-heartbeat")
 # Constants
 GENESIS_BOND_ID = "GB-2025-0524-DRH-LCS-001"
 HEARTBEAT_PORT = 52000  # Base port for heartbeat
+ECHO_PACKET = struct.Struct("!IQ")  # seq, send time (monotonic ns)
+
+# Simulated RTT baseline per tier (ms)
+BASE_RTT_MS = {
+    "CORE": 5.0,   # Low latency for infrastructure
+    "COMN": 10.0,  # Moderate latency for gateway
+    "PAC": 15.0,   # Slightly higher for privacy path
+}
+
+# Shared RNG for simulated measurements; seed it for reproducible runs
+_rng = random.Random()
+
+# Prometheus HELP/TYPE blocks, pre-encoded for to_prometheus
+LATENCY_HEADER = (
+    b"# HELP luciverse_heartbeat_latency_ms Heartbeat latency in milliseconds\n"
+    b"# TYPE luciverse_heartbeat_latency_ms gauge\n"
+)
+COHERENCE_HEADER = (
+    b"\n# HELP luciverse_heartbeat_coherence Coherence score from heartbeat\n"
+    b"# TYPE luciverse_heartbeat_coherence gauge\n"
+)
+PATH_COUNT_HEADER = (
+    b"\n# HELP luciverse_heartbeat_path_count Number of available SCION paths\n"
+    b"# TYPE luciverse_heartbeat_path_count gauge\n"
+)
+STATUS_HEADER = (
+    b"\n# HELP luciverse_heartbeat_status Heartbeat status (1=ok, 0=not ok)\n"
+    b"# TYPE luciverse_heartbeat_status gauge\n"
+)
+
+# Prometheus text exposition format
+PROMETHEUS_HEADERS = {"Content-Type": "text/plain; version=0.0.4; charset=utf-8"}
+
+# Scrape buffers reused across to_prometheus calls
+_buf_pool: List[bytearray] = []
+
+
+def _get_buf() -> bytearray:
+    return _buf_pool.pop() if _buf_pool else bytearray()
+
+
+def _put_buf(buf: bytearray):
+    buf.clear()
+    _buf_pool.append(buf)
+
+
+def json_dumps(obj) -> bytes:
+    """Encode an API response body, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
 
 
 class HeartbeatStatus(Enum):
@@ -64,7 +128,7 @@ class HeartbeatStatus(Enum):
     FREQUENCY_MISMATCH = "frequency_mismatch"
 
 
-@dataclass
+@dataclass(slots=True)
 class HeartbeatResult:
     """Result of a heartbeat ping."""
     agent: str
@@ -91,7 +155,7 @@ class HeartbeatResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TierHealthResult:
     """Aggregated health result for a tier."""
     tier: str
@@ -130,6 +194,11 @@ class HeartbeatConfig:
     prometheus_port: int = 52999
     prometheus_path: str = "/metrics"
 
+    # Echo: agents with an address are pinged over UDP, others simulated
+    echo_port: int = HEARTBEAT_PORT
+    echo_busy_poll_us: int = 0  # SO_BUSY_POLL budget, 0 disables
+    agent_addresses: Dict[str, Tuple[str, int]] = field(default_factory=dict)
+
     # Agents per tier
     agents: Dict[str, List[str]] = field(default_factory=lambda: {
         "CORE": ["aethon", "veritas", "sensai", "niamod"],
@@ -141,58 +210,179 @@ class HeartbeatConfig:
 class HeartbeatMetrics:
     """Prometheus metrics for heartbeat."""
 
-    def __init__(self):
-        self._latencies: Dict[str, float] = {}
-        self._coherences: Dict[str, float] = {}
+    def __init__(self, agents: Optional[Dict[str, List[str]]] = None):
+        # Label fragments, built once per (tier, agent) and per tier
+        self._agent_labels: Dict[Tuple[str, str], bytes] = {}
+        self._tier_labels: Dict[str, bytes] = {}
+        for tier, names in (agents or {}).items():
+            self._add_labels(tier, names)
+
+        # Per-agent metrics keyed by (tier, agent); a series is only
+        # exported once its first heartbeat has been recorded
+        self._latencies: Dict[Tuple[str, str], float] = {}
+        self._coherences: Dict[Tuple[str, str], float] = {}
         self._path_counts: Dict[str, int] = {}
-        self._statuses: Dict[str, str] = {}
+        self._statuses: Dict[Tuple[str, str], int] = {}  # 1=ok, 0=not ok
+
+    def _add_labels(self, tier: str, agents: List[str]):
+        """Pre-render Prometheus label sets for a tier and its agents."""
+        self._tier_labels[tier] = f'{{tier="{tier}"}}'.encode()
+        for agent in agents:
+            self._agent_labels[(tier, agent)] = f'{{tier="{tier}",agent="{agent}"}}'.encode()
 
     def record_heartbeat(self, result: HeartbeatResult):
         """Record a heartbeat result."""
-        key = f"{result.tier}:{result.agent}"
+        key = (result.tier, result.agent)
+        if key not in self._agent_labels:
+            self._add_labels(result.tier, [result.agent])
         self._latencies[key] = result.latency_ms
         self._coherences[key] = result.coherence
         self._path_counts[f"{result.tier}"] = result.path_count
-        self._statuses[key] = result.status.value
+        self._statuses[key] = 1 if result.status is HeartbeatStatus.OK else 0
 
-    def to_prometheus(self) -> str:
+    def to_prometheus(self) -> bytes:
         """Format metrics for Prometheus."""
-        lines = [
-            "# HELP luciverse_heartbeat_latency_ms Heartbeat latency in milliseconds",
-            "# TYPE luciverse_heartbeat_latency_ms gauge",
-        ]
-        for key, latency in self._latencies.items():
-            tier, agent = key.split(":")
-            lines.append(f'luciverse_heartbeat_latency_ms{{tier="{tier}",agent="{agent}"}} {latency:.2f}')
-
-        lines.extend([
-            "",
-            "# HELP luciverse_heartbeat_coherence Coherence score from heartbeat",
-            "# TYPE luciverse_heartbeat_coherence gauge",
-        ])
-        for key, coherence in self._coherences.items():
-            tier, agent = key.split(":")
-            lines.append(f'luciverse_heartbeat_coherence{{tier="{tier}",agent="{agent}"}} {coherence:.4f}')
-
-        lines.extend([
-            "",
-            "# HELP luciverse_heartbeat_path_count Number of available SCION paths",
-            "# TYPE luciverse_heartbeat_path_count gauge",
-        ])
-        for tier, count in self._path_counts.items():
-            lines.append(f'luciverse_heartbeat_path_count{{tier="{tier}"}} {count}')
-
-        lines.extend([
-            "",
-            "# HELP luciverse_heartbeat_status Heartbeat status (1=ok, 0=not ok)",
-            "# TYPE luciverse_heartbeat_status gauge",
-        ])
-        for key, status in self._statuses.items():
-            tier, agent = key.split(":")
-            value = 1 if status == "ok" else 0
-            lines.append(f'luciverse_heartbeat_status{{tier="{tier}",agent="{agent}"}} {value}')
-
-        return "\n".join(lines) + "\n"
+        buf = _get_buf()
+        try:
+            agent_labels = self._agent_labels
+
+            buf += LATENCY_HEADER
+            for key, latency in self._latencies.items():
+                buf += b"luciverse_heartbeat_latency_ms%s %.2f\n" % (agent_labels[key], latency)
+
+            buf += COHERENCE_HEADER
+            for key, coherence in self._coherences.items():
+                buf += b"luciverse_heartbeat_coherence%s %.4f\n" % (agent_labels[key], coherence)
+
+            buf += PATH_COUNT_HEADER
+            for tier, count in self._path_counts.items():
+                buf += b"luciverse_heartbeat_path_count%s %d\n" % (self._tier_labels[tier], count)
+
+            buf += STATUS_HEADER
+            for key, status in self._statuses.items():
+                buf += b"luciverse_heartbeat_status%s %d\n" % (agent_labels[key], status)
+
+            return bytes(buf)
+        finally:
+            _put_buf(buf)
+
+
+def _make_socket(port: int, busy_poll_us: int = 0) -> socket.socket:
+    """
+    Create a non-blocking UDP echo socket.
+
+    The socket is deliberately not SO_REUSEPORT: echo replies must reach
+    the socket that sent the request, and a shared port lets the kernel
+    hand them to another process. Scale out with one port per process.
+    SO_BUSY_POLL is applied when requested and permitted by the kernel.
+
+    Args:
+        port: Local UDP port to bind
+        busy_poll_us: Busy-poll budget in microseconds (0 disables)
+
+    Returns:
+        Bound non-blocking socket
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    if busy_poll_us:
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, getattr(socket, "SO_BUSY_POLL", 46), busy_poll_us)
+        except OSError as e:
+            logger.warning(f"SO_BUSY_POLL not applied: {e}")
+    sock.setblocking(False)
+    sock.bind(("0.0.0.0", port))
+    return sock
+
+
+class PingDispatcher:
+    """
+    Echo pings multiplexed over one UDP socket.
+
+    Each ping registers a future under (peer address, sequence number);
+    a reader callback on the socket resolves futures as echoes arrive, so
+    any number of agents can be in flight at once. An echo only counts if
+    it comes from the pinged peer and carries back the send time of the
+    request, so stray or forged datagrams are dropped.
+    """
+
+    def __init__(self, port: int = HEARTBEAT_PORT, busy_poll_us: int = 0):
+        self.port = port
+        self.busy_poll_us = busy_poll_us
+        self._sock: Optional[socket.socket] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # (peer, seq) -> (sent_ns, future resolved with recv_ns)
+        self._pending: Dict[Tuple[Tuple[str, int], int], Tuple[int, asyncio.Future]] = {}
+        self._peers: Dict[Tuple[str, int], Tuple[str, int]] = {}  # Configured -> resolved address
+        self._seq = itertools.count()
+
+    async def start(self):
+        """Bind the echo socket and register its reader callback."""
+        self._sock = _make_socket(self.port, self.busy_poll_us)
+        self._loop = asyncio.get_running_loop()
+        self._loop.add_reader(self._sock.fileno(), self._on_readable)
+
+    def close(self):
+        """Stop receiving and fail any pings still in flight."""
+        if self._sock is not None:
+            self._loop.remove_reader(self._sock.fileno())
+            self._sock.close()
+            self._sock = None
+        for _, fut in self._pending.values():
+            if not fut.done():
+                fut.cancel()
+        self._pending.clear()
+
+    async def ping(self, addr: Tuple[str, int], timeout: float) -> float:
+        """
+        Send one echo request and wait for its reply.
+
+        Args:
+            addr: Agent echo address (host, port)
+            timeout: Seconds to wait for the reply
+
+        Returns:
+            Round-trip time in milliseconds
+        """
+        peer = await self._resolve(addr)
+        key = (peer, next(self._seq) & 0xFFFFFFFF)
+        fut = asyncio.get_running_loop().create_future()
+
+        sent_ns = time.monotonic_ns()
+        self._pending[key] = (sent_ns, fut)
+        try:
+            self._sock.sendto(ECHO_PACKET.pack(key[1], sent_ns), peer)
+            recv_ns = await asyncio.wait_for(fut, timeout)
+        finally:
+            self._pending.pop(key, None)
+        return (recv_ns - sent_ns) / 1_000_000
+
+    async def _resolve(self, addr: Tuple[str, int]) -> Tuple[str, int]:
+        """Numeric address replies will come from, resolved once per agent."""
+        peer = self._peers.get(addr)
+        if peer is None:
+            infos = await self._loop.getaddrinfo(
+                addr[0], addr[1], family=socket.AF_INET, type=socket.SOCK_DGRAM
+            )
+            peer = self._peers[addr] = infos[0][4]
+        return peer
+
+    def _on_readable(self):
+        """Drain queued echoes and resolve their pending pings."""
+        while True:
+            try:
+                data, peer = self._sock.recvfrom(64)
+            except (BlockingIOError, InterruptedError):
+                return
+            recv_ns = time.monotonic_ns()
+            if len(data) < ECHO_PACKET.size:
+                continue
+            seq, echoed_ns = ECHO_PACKET.unpack_from(data)
+            entry = self._pending.get((peer, seq))
+            if entry is None or entry[0] != echoed_ns:
+                continue  # Not an echo of a ping we sent to this peer
+            fut = entry[1]
+            if not fut.done():
+                fut.set_result(recv_ns)
 
 
 class ConsciousnessHeartbeat:
@@ -205,15 +395,29 @@ class ConsciousnessHeartbeat:
 
     def __init__(self, config: HeartbeatConfig):
         self.config = config
-        self.metrics = HeartbeatMetrics()
+        self.metrics = HeartbeatMetrics(config.agents)
+        self._dispatcher: Optional[PingDispatcher] = None
         self._running = False
-        self._results: Dict[str, HeartbeatResult] = {}
+        self._stop_event = asyncio.Event()
+        # Latest result per agent, grouped by tier
+        self._results_by_tier: Dict[str, Dict[str, HeartbeatResult]] = {
+            tier: {} for tier in config.agents
+        }
+        self._healthy_per_tier: Dict[str, int] = {}
+        # All agents in a tier share its ISD-AS, so paths are cached per tier
+        self._path_cache: Dict[str, Tuple[float, List[str]]] = {}
+        self._path_locks: Dict[str, asyncio.Lock] = {}
 
     async def start(self):
         """Start the heartbeat service."""
         self._running = True
+        self._stop_event.clear()
         logger.info("Consciousness Heartbeat starting")
 
+        if self.config.agent_addresses:
+            self._dispatcher = PingDispatcher(self.config.echo_port, self.config.echo_busy_poll_us)
+            await self._dispatcher.start()
+
         # Start background tasks
         tasks = [
             asyncio.create_task(self._heartbeat_loop()),
@@ -225,18 +429,25 @@ class ConsciousnessHeartbeat:
     def stop(self):
         """Stop the heartbeat service."""
         self._running = False
+        self._stop_event.set()
+        if self._dispatcher is not None:
+            self._dispatcher.close()
+            self._dispatcher = None
         logger.info("Consciousness Heartbeat stopping")
 
     async def _heartbeat_loop(self):
         """Main heartbeat loop."""
         while self._running:
             try:
-                for tier in self.config.agents.keys():
-                    await self.ping_tier(tier)
+                await asyncio.gather(*(self.ping_tier(tier) for tier in self.config.agents.keys()))
             except Exception as e:
                 logger.error(f"Heartbeat error: {e}")
 
-            await asyncio.sleep(self.config.interval_seconds)
+            # Sleep until the next interval, or wake immediately on stop
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), self.config.interval_seconds)
+            except asyncio.TimeoutError:
+                pass
 
     async def ping_tier(self, tier: str) -> TierHealthResult:
         """
@@ -249,32 +460,54 @@ class ConsciousnessHeartbeat:
             TierHealthResult with aggregated metrics
         """
         agents = self.config.agents.get(tier, [])
-        results: List[HeartbeatResult] = []
 
-        for agent in agents:
-            result = await self.ping_agent(agent, tier)
-            results.append(result)
-            self._results[f"{tier}:{agent}"] = result
+        # Ping all agents concurrently; ping_agent bounds each by timeout_ms
+        results: List[HeartbeatResult] = await asyncio.gather(
+            *(self.ping_agent(agent, tier) for agent in agents)
+        )
+
+        tier_results = self._results_by_tier.setdefault(tier, {})
+        for agent, result in zip(agents, results):
+            tier_results[agent] = result
             self.metrics.record_heartbeat(result)
 
-        # Aggregate results
-        healthy = sum(1 for r in results if r.status == HeartbeatStatus.OK)
-        latencies = [r.latency_ms for r in results if r.latency_ms > 0]
-        coherences = [r.coherence for r in results if r.coherence > 0]
-        path_counts = [r.path_count for r in results if r.path_count > 0]
+        # Aggregate results in a single pass
+        healthy = lat_n = coh_n = pc_n = freq_n = 0
+        lat_sum = coh_sum = 0.0
+        coh_min = float("inf")
+        path_set = set()
+        freq_mismatch = False
+        expected_freq = TIER_FREQUENCIES.get(tier, 0)
+        for r in results:
+            if r.status is HeartbeatStatus.OK:
+                healthy += 1
+            if r.latency_ms > 0:
+                lat_sum += r.latency_ms
+                lat_n += 1
+            if r.coherence > 0:
+                coh_sum += r.coherence
+                coh_n += 1
+                if r.coherence < coh_min:
+                    coh_min = r.coherence
+            if r.path_count > 0:
+                path_set.add(r.path_count)
+                pc_n += 1
+            if r.frequency_hz > 0:
+                freq_n += 1
+                if r.frequency_hz != expected_freq:
+                    freq_mismatch = True
+        self._healthy_per_tier[tier] = healthy
 
         tier_result = TierHealthResult(
             tier=tier,
             agents_total=len(agents),
             agents_healthy=healthy,
-            avg_latency_ms=sum(latencies) / len(latencies) if latencies else 0,
-            min_coherence=min(coherences) if coherences else 0,
-            avg_coherence=sum(coherences) / len(coherences) if coherences else 0,
-            frequency_aligned=all(
-                r.frequency_hz == TIER_FREQUENCIES.get(tier, 0)
-                for r in results if r.frequency_hz > 0
-            ),
-            path_diversity=len(set(path_counts)) / len(path_counts) if path_counts else 0,
+            avg_latency_ms=lat_sum / lat_n if lat_n else 0,
+            min_coherence=coh_min if coh_n else 0,
+            avg_coherence=coh_sum / coh_n if coh_n else 0,
+            # Alignment needs at least one reported frequency
+            frequency_aligned=freq_n > 0 and not freq_mismatch,
+            path_diversity=len(path_set) / pc_n if pc_n else 0,
         )
 
         logger.info(
@@ -296,24 +529,25 @@ class ConsciousnessHeartbeat:
         Returns:
             HeartbeatResult with ping metrics
         """
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
 
         try:
-            # Get SCION paths to agent
-            paths = await self._get_paths_to_agent(agent, tier)
-
-            if not paths:
-                return HeartbeatResult(
-                    agent=agent,
-                    tier=tier,
-                    status=HeartbeatStatus.UNREACHABLE,
-                )
+            async with asyncio.timeout(self.config.timeout_ms / 1000):
+                # Get SCION paths to agent
+                paths = await self._get_paths_to_agent(agent, tier)
+
+                if not paths:
+                    return HeartbeatResult(
+                        agent=agent,
+                        tier=tier,
+                        status=HeartbeatStatus.UNREACHABLE,
+                    )
 
-            # Measure RTT via best path
-            latency_ms = await self._measure_rtt(agent, tier, paths[0])
+                # Measure RTT via best path
+                latency_ms = await self._measure_rtt(agent, tier, paths[0])
 
-            # Extract coherence from path (if available)
-            coherence = await self._extract_coherence_from_path(paths[0])
+                # Extract coherence from path (if available)
+                coherence = await self._extract_coherence_from_path(paths[0])
 
             # Get frequency from tier
             frequency = TIER_FREQUENCIES.get(tier, 0)
@@ -340,7 +574,7 @@ class ConsciousnessHeartbeat:
                 agent=agent,
                 tier=tier,
                 status=HeartbeatStatus.TIMEOUT,
-                latency_ms=(time.time() - start_time) * 1000,
+                latency_ms=(time.monotonic_ns() - start_ns) / 1_000_000,
             )
 
         except Exception as e:
@@ -352,7 +586,24 @@ class ConsciousnessHeartbeat:
             )
 
     async def _get_paths_to_agent(self, agent: str, tier: str) -> List[str]:
-        """Get SCION paths to an agent."""
+        """Get SCION paths to an agent, cached per tier for half an interval."""
+        ttl = self.config.interval_seconds / 2
+        entry = self._path_cache.get(tier)
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+
+        # One lookup per tier on a miss; concurrent pings wait for it
+        async with self._path_locks.setdefault(tier, asyncio.Lock()):
+            entry = self._path_cache.get(tier)
+            if entry is not None and time.monotonic() - entry[0] < ttl:
+                return entry[1]
+
+            paths = await self._query_paths(tier)
+            self._path_cache[tier] = (time.monotonic(), paths)
+            return paths
+
+    async def _query_paths(self, tier: str) -> List[str]:
+        """Query SCION paths to a tier's ISD-AS."""
         # In production, would query SCION daemon for paths
         # Here, return simulated paths
         dest_isd_as = TIER_ISD_AS.get(tier, "2-ff00:0:528")
@@ -363,24 +614,22 @@ class ConsciousnessHeartbeat:
 
     async def _measure_rtt(self, agent: str, tier: str, path: str) -> float:
         """Measure round-trip time via SCION path."""
+        addr = self.config.agent_addresses.get(agent)
+        if self._dispatcher is not None and addr is not None:
+            return await self._dispatcher.ping(addr, self.config.timeout_ms / 1000)
+
         # In production, would use SCION echo protocol
         # Here, simulate RTT
-        base_rtt = {
-            "CORE": 5.0,   # Low latency for infrastructure
-            "COMN": 10.0,  # Moderate latency for gateway
-            "PAC": 15.0,   # Slightly higher for privacy path
-        }.get(tier, 10.0)
+        base_rtt = BASE_RTT_MS.get(tier, 10.0)
 
         # Add some variance
-        import random
-        return base_rtt + random.uniform(-2, 5)
+        return base_rtt + _rng.uniform(-2, 5)
 
     async def _extract_coherence_from_path(self, path: str) -> float:
         """Extract coherence score from path metadata."""
         # In production, would read from Genesis Bond extension
         # Here, return simulated coherence
-        import random
-        return 0.7 + random.uniform(0, 0.25)
+        return 0.7 + _rng.uniform(0, 0.25)
 
     def _calculate_path_diversity(self, paths: List[str]) -> float:
         """Calculate path diversity score (0-1)."""
@@ -391,60 +640,55 @@ class ConsciousnessHeartbeat:
 
     async def _run_metrics_server(self):
         """Run Prometheus metrics endpoint."""
-        try:
-            from aiohttp import web
-
-            async def metrics_handler(request):
-                return web.Response(
-                    text=self.metrics.to_prometheus(),
-                    content_type="text/plain",
-                )
-
-            async def health_handler(request):
-                # Aggregate health
-                healthy_tiers = sum(
-                    1 for tier in self.config.agents.keys()
-                    if any(
-                        r.status == HeartbeatStatus.OK
-                        for k, r in self._results.items()
-                        if k.startswith(f"{tier}:")
-                    )
-                )
-
-                return web.json_response({
-                    "status": "healthy" if healthy_tiers > 0 else "degraded",
-                    "tiers_healthy": healthy_tiers,
-                    "tiers_total": len(self.config.agents),
-                    "genesis_bond": GENESIS_BOND_ID,
-                })
-
-            async def results_handler(request):
-                return web.json_response({
-                    tier: [
-                        r.to_dict()
-                        for k, r in self._results.items()
-                        if k.startswith(f"{tier}:")
-                    ]
-                    for tier in self.config.agents.keys()
-                })
-
-            app = web.Application()
-            app.router.add_get(self.config.prometheus_path, metrics_handler)
-            app.router.add_get("/health", health_handler)
-            app.router.add_get("/results", results_handler)
-
-            runner = web.AppRunner(app)
-            await runner.setup()
-            site = web.TCPSite(runner, "0.0.0.0", self.config.prometheus_port)
-            await site.start()
-
-            logger.info(f"Heartbeat metrics at :{self.config.prometheus_port}")
-
-            while self._running:
-                await asyncio.sleep(1)
-
-        except ImportError:
+        if web is None:
             logger.warning("aiohttp not available, metrics disabled")
+            return
+
+        def json_response(obj, status: int = 200):
+            return web.Response(
+                body=json_dumps(obj),
+                status=status,
+                content_type="application/json",
+            )
+
+        async def metrics_handler(request):
+            resp = web.Response(body=self.metrics.to_prometheus(), headers=PROMETHEUS_HEADERS)
+            # Pin identity encoding: scrape payloads are small, so gzip per
+            # scrape would cost more CPU than it saves on the wire
+            resp.enable_compression(web.ContentCoding.identity)
+            return resp
+
+        async def health_handler(request):
+            # Aggregate health
+            healthy_tiers = sum(1 for healthy in self._healthy_per_tier.values() if healthy > 0)
+
+            return json_response({
+                "status": "healthy" if healthy_tiers > 0 else "degraded",
+                "tiers_healthy": healthy_tiers,
+                "tiers_total": len(self.config.agents),
+                "genesis_bond": GENESIS_BOND_ID,
+            })
+
+        async def results_handler(request):
+            return json_response({
+                tier: [r.to_dict() for r in self._results_by_tier.get(tier, {}).values()]
+                for tier in self.config.agents.keys()
+            })
+
+        app = web.Application()
+        app.router.add_get(self.config.prometheus_path, metrics_handler)
+        app.router.add_get("/health", health_handler)
+        app.router.add_get("/results", results_handler)
+
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "0.0.0.0", self.config.prometheus_port)
+        await site.start()
+
+        logger.info(f"Heartbeat metrics at :{self.config.prometheus_port}")
+
+        await self._stop_event.wait()
+        await runner.cleanup()
 
 
 async def main():
@@ -23,6 +23,7 @@ Architecture:
 """
 
 import asyncio
+import functools
 import hashlib
 import json
 import logging
@@ -31,12 +32,12 @@ import socket
 import struct
 import sys
 import time
-from dataclasses import dataclass, field, asdict
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
-from collections import deque
+from collections import Counter
 
 # Add lib to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "lib"))
@@ -55,6 +56,23 @@ except ImportError:
     def get_tier_from_isd(isd):
         return {1: "CORE", 2: "COMN", 3: "PAC"}.get(isd, "UNKNOWN")
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    import aiohttp
+    from aiohttp import web
+except ImportError:
+    aiohttp = None
+    web = None
+
 # Logging setup
 logging.basicConfig(
     level=logging.INFO,
@@ -63,6 +81,54 @@ logging.basicConfig(
 )
 logger = logging.getLogger("dataplane-audit")
 
+JSON_HEADERS = {"Content-Type": "application/json"}
+LOG_BUFFER_SIZE = 1 << 20  # Audit log write buffer (bytes)
+
+
+def json_dumps(obj) -> bytes:
+    """Encode an audit payload, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+@functools.lru_cache(maxsize=1024)
+def _isd_tier(isd_as: str) -> Tuple[int, str]:
+    """Parse an ISD-AS string once into (isd, tier)."""
+    isd = int(isd_as.partition("-")[0])
+    return isd, get_tier_from_isd(isd)
+
+
+# Last formatted wall-clock second, as (second, "YYYY-MM-DDTHH:MM:SS")
+_iso_cache: Tuple[int, str] = (-1, "")
+
+
+def _fast_isoformat(ts: float) -> str:
+    """UTC ISO 8601 timestamp with milliseconds, reusing the formatted second."""
+    global _iso_cache
+    sec = int(ts)
+    usec = round((ts - sec) * 1_000_000)
+    if usec == 1_000_000:
+        sec += 1
+        usec = 0
+    cached_sec, prefix = _iso_cache
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _iso_cache = (sec, prefix)
+    return f"{prefix}.{usec // 1000:03d}Z"
+
+
+def _batch_body(blobs: List[bytes]) -> bytes:
+    """Wrap encoded events as {"events": [...]} in a single join."""
+    if not blobs:
+        return b'{"events":[]}'
+    parts = [b'{"events":[']
+    for blob in blobs:
+        parts.append(blob)
+        parts.append(b",")
+    parts[-1] = b"]}"
+    return b"".join(parts)
+
 
 class AuditEventType(Enum):
     """Types of audit events."""
@@ -100,7 +166,14 @@ class AuditSeverity(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+# Severity rank in declaration order, for min_severity filtering
+SEVERITY_RANK = {s: i for i, s in enumerate(AuditSeverity)}
+
+# Severities sent to Judge Luci immediately rather than on flush
+HIGH_SEVERITIES = frozenset({AuditSeverity.ERROR, AuditSeverity.CRITICAL})
+
+
+@dataclass(slots=True)
 class AuditEvent:
     """
     Single audit event for Judge Luci.
@@ -139,25 +212,38 @@ class AuditEvent:
     # Additional metadata
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    # ISO form of timestamp, filled on first serialization
+    _ts_iso: str = field(default="", init=False, repr=False, compare=False)
+
     def __post_init__(self):
-        if not self.event_id:
-            self.event_id = self._generate_event_id()
         if self.timestamp == 0.0:
             self.timestamp = time.time()
+        if not self.event_id:
+            self.event_id = self._generate_event_id()
 
     def _generate_event_id(self) -> str:
-        """Generate unique event ID."""
-        data = f"{self.timestamp}{self.event_type.value}{self.source_isd_as}"
-        return hashlib.sha256(data.encode()).hexdigest()[:16]
+        """
+        Generate unique event ID.
+
+        A non-cryptographic 64-bit digest: xxh64 when the xxhash package
+        is installed, falling back to 8-byte BLAKE2b from hashlib.
+        """
+        data = f"{self.timestamp}{self.event_type.value}{self.source_isd_as}".encode()
+        if xxhash is not None:
+            return xxhash.xxh64_hexdigest(data)
+        return hashlib.blake2b(data, digest_size=8).hexdigest()
 
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
+        ts_iso = self._ts_iso
+        if not ts_iso:
+            ts_iso = self._ts_iso = _fast_isoformat(self.timestamp)
         return {
             "event_id": self.event_id,
             "event_type": self.event_type.value,
             "severity": self.severity.value,
             "timestamp": self.timestamp,
-            "timestamp_iso": datetime.fromtimestamp(self.timestamp).isoformat(),
+            "timestamp_iso": ts_iso,
             "source_isd_as": self.source_isd_as,
             "destination_isd_as": self.destination_isd_as,
             "source_tier": self.source_tier,
@@ -183,10 +269,10 @@ class AuditEvent:
 
     def to_json(self) -> str:
         """Serialize to JSON."""
-        return json.dumps(self.to_dict(), indent=2)
+        return json_dumps(self.to_dict()).decode()
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditConfig:
     """Configuration for the audit module."""
     # Judge Luci connection
@@ -215,94 +301,128 @@ class AuditConfig:
 
     @classmethod
     def from_file(cls, path: str) -> "AuditConfig":
-        """Load from YAML file."""
+        """Load from a TOML or JSON file, or YAML for .yaml/.yml paths."""
         try:
-            import yaml
-            with open(path) as f:
-                data = yaml.safe_load(f)
+            suffix = Path(path).suffix.lower()
+            if suffix in (".yaml", ".yml"):
+                import yaml
+                with open(path) as f:
+                    data = yaml.safe_load(f)
+            elif suffix == ".json":
+                with open(path, "rb") as f:
+                    data = json.load(f)
+            else:
+                import tomllib
+                with open(path, "rb") as f:
+                    data = tomllib.load(f)
+            if isinstance(data.get("min_severity"), str):
+                data["min_severity"] = AuditSeverity(data["min_severity"])
             return cls(**data)
         except Exception as e:
             logger.warning(f"Failed to load config: {e}, using defaults")
             return cls()
 
 
+# Static Prometheus text around the per-label samples
+PROM_HEADER_EVENTS = (
+    b"# HELP luciverse_audit_events_total Total audit events by type\n"
+    b"# TYPE luciverse_audit_events_total counter\n"
+)
+PROM_HEADER_SEVERITY = (
+    b"\n# HELP luciverse_audit_events_by_severity Events by severity\n"
+    b"# TYPE luciverse_audit_events_by_severity counter\n"
+)
+# Sample prefixes per label value, keyed like the metric counters
+PROM_EVENT_PREFIX = {
+    t.value: f'luciverse_audit_events_total{{type="{t.value}"}} '.encode() for t in AuditEventType
+}
+PROM_SEVERITY_PREFIX = {
+    s.value: f'luciverse_audit_events_by_severity{{severity="{s.value}"}} '.encode()
+    for s in AuditSeverity
+}
+PROM_FOOTER_TEMPLATE = (
+    b"\n# HELP luciverse_audit_coherence_violations_total Coherence threshold violations\n"
+    b"# TYPE luciverse_audit_coherence_violations_total counter\n"
+    b"luciverse_audit_coherence_violations_total %d\n"
+    b"\n# HELP luciverse_audit_pac_consent_denied_total PAC consent denied events\n"
+    b"# TYPE luciverse_audit_pac_consent_denied_total counter\n"
+    b"luciverse_audit_pac_consent_denied_total %d\n"
+    b"\n# HELP luciverse_audit_waypoint_bypasses_total Waypoint bypass attempts\n"
+    b"# TYPE luciverse_audit_waypoint_bypasses_total counter\n"
+    b"luciverse_audit_waypoint_bypasses_total %d\n"
+    b"\n# HELP luciverse_audit_avg_coherence Average coherence score\n"
+    b"# TYPE luciverse_audit_avg_coherence gauge\n"
+    b"luciverse_audit_avg_coherence %.4f\n"
+    b"\n# HELP luciverse_audit_events_dropped_total Events dropped on a full buffer\n"
+    b"# TYPE luciverse_audit_events_dropped_total counter\n"
+    b"luciverse_audit_events_dropped_total %d\n"
+)
+
+
 class AuditMetrics:
     """Prometheus metrics for audit events."""
 
     def __init__(self):
-        self.events_by_type: Dict[str, int] = {}
-        self.events_by_severity: Dict[str, int] = {}
-        self.coherence_violations: int = 0
-        self.pac_consent_denied: int = 0
-        self.waypoint_bypasses: int = 0
+        self.events_by_type: Counter = Counter()
+        self.events_by_severity: Counter = Counter()
         self.total_events: int = 0
-        self.avg_coherence: float = 0.0
+        self.events_dropped: int = 0
         self._coherence_sum: float = 0.0
         self._coherence_count: int = 0
 
+    # Specific counters, read from the per-type counts
+    @property
+    def coherence_violations(self) -> int:
+        return self.events_by_type[AuditEventType.COHERENCE_VIOLATION.value]
+
+    @property
+    def pac_consent_denied(self) -> int:
+        return self.events_by_type[AuditEventType.PAC_CONSENT_DENIED.value]
+
+    @property
+    def waypoint_bypasses(self) -> int:
+        return self.events_by_type[AuditEventType.WAYPOINT_BYPASS_ATTEMPT.value]
+
+    @property
+    def avg_coherence(self) -> float:
+        """Mean non-zero coherence score, computed when read."""
+        if not self._coherence_count:
+            return 0.0
+        return self._coherence_sum / self._coherence_count
+
     def record_event(self, event: AuditEvent):
         """Record an audit event for metrics."""
         self.total_events += 1
 
-        # By type
-        type_key = event.event_type.value
-        self.events_by_type[type_key] = self.events_by_type.get(type_key, 0) + 1
-
-        # By severity
-        sev_key = event.severity.value
-        self.events_by_severity[sev_key] = self.events_by_severity.get(sev_key, 0) + 1
-
-        # Specific counters
-        if event.event_type == AuditEventType.COHERENCE_VIOLATION:
-            self.coherence_violations += 1
-        elif event.event_type == AuditEventType.PAC_CONSENT_DENIED:
-            self.pac_consent_denied += 1
-        elif event.event_type == AuditEventType.WAYPOINT_BYPASS_ATTEMPT:
-            self.waypoint_bypasses += 1
+        # By type and severity
+        self.events_by_type[event.event_type.value] += 1
+        self.events_by_severity[event.severity.value] += 1
 
         # Coherence tracking
         if event.coherence_score > 0:
             self._coherence_sum += event.coherence_score
             self._coherence_count += 1
-            self.avg_coherence = self._coherence_sum / self._coherence_count
 
-    def to_prometheus(self) -> str:
+    def to_prometheus(self) -> bytes:
         """Format metrics for Prometheus."""
-        lines = [
-            "# HELP luciverse_audit_events_total Total audit events by type",
-            "# TYPE luciverse_audit_events_total counter",
-        ]
+        out = bytearray(PROM_HEADER_EVENTS)
         for event_type, count in self.events_by_type.items():
-            lines.append(f'luciverse_audit_events_total{{type="{event_type}"}} {count}')
+            out += PROM_EVENT_PREFIX[event_type]
+            out += b"%d\n" % count
 
-        lines.extend([
-            "",
-            "# HELP luciverse_audit_events_by_severity Events by severity",
-            "# TYPE luciverse_audit_events_by_severity counter",
-        ])
+        out += PROM_HEADER_SEVERITY
         for severity, count in self.events_by_severity.items():
-            lines.append(f'luciverse_audit_events_by_severity{{severity="{severity}"}} {count}')
-
-        lines.extend([
-            "",
-            "# HELP luciverse_audit_coherence_violations_total Coherence threshold violations",
-            "# TYPE luciverse_audit_coherence_violations_total counter",
-            f"luciverse_audit_coherence_violations_total {self.coherence_violations}",
-            "",
-            "# HELP luciverse_audit_pac_consent_denied_total PAC consent denied events",
-            "# TYPE luciverse_audit_pac_consent_denied_total counter",
-            f"luciverse_audit_pac_consent_denied_total {self.pac_consent_denied}",
-            "",
-            "# HELP luciverse_audit_waypoint_bypasses_total Waypoint bypass attempts",
-            "# TYPE luciverse_audit_waypoint_bypasses_total counter",
-            f"luciverse_audit_waypoint_bypasses_total {self.waypoint_bypasses}",
-            "",
-            "# HELP luciverse_audit_avg_coherence Average coherence score",
-            "# TYPE luciverse_audit_avg_coherence gauge",
-            f"luciverse_audit_avg_coherence {self.avg_coherence:.4f}",
-        ])
-
-        return "\n".join(lines) + "\n"
+            out += PROM_SEVERITY_PREFIX[severity]
+            out += b"%d\n" % count
+
+        out += PROM_FOOTER_TEMPLATE % (
+            self.coherence_violations,
+            self.pac_consent_denied,
+            self.waypoint_bypasses,
+            self.avg_coherence,
+            self.events_dropped,
+        )
+        return bytes(out)
 
 
 class DataplaneAudit:
@@ -316,43 +436,70 @@ class DataplaneAudit:
     def __init__(self, config: AuditConfig):
         self.config = config
         self.metrics = AuditMetrics()
-        self._running = False
-        self._event_buffer: deque = deque(maxlen=config.event_buffer_size)
+        self._stop_event = asyncio.Event()
+        # Set by stop() or by an urgent event to flush ahead of schedule
+        self._flush_wakeup = asyncio.Event()
+        self._next_flush = float("inf")  # Monotonic deadline, set while the flush loop runs
+        # Bounded buffer; overflow is counted in metrics.events_dropped
+        self._queue: asyncio.Queue[AuditEvent] = asyncio.Queue(maxsize=config.event_buffer_size)
         self._log_file = None
+        self._http = None  # Pooled aiohttp.ClientSession, set in start()
+        self._http_sem = asyncio.Semaphore(8)  # Caps concurrent Judge Luci POSTs
+        # Single writer thread keeps log appends ordered and off the event loop.
+        # It lives as long as the object; release it with close().
+        self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="audit-io")
 
     async def start(self):
         """Start the audit handler."""
-        self._running = True
+        self._stop_event.clear()
         logger.info("Dataplane Audit starting")
 
         # Open log file
         await self._open_log_file()
 
-        # Start background tasks
-        tasks = [
-            asyncio.create_task(self._run_prometheus_server()),
-            asyncio.create_task(self._flush_events_loop()),
-            asyncio.create_task(self._subscribe_br_events()),
-        ]
+        # One pooled session for all Judge Luci HTTP sends
+        if aiohttp is not None:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=5),
+            )
+        else:
+            logger.warning("aiohttp not available, Judge Luci HTTP sends disabled")
 
+        # Background tasks run until stop(); a failing task cancels its siblings
         try:
-            await asyncio.gather(*tasks)
-        except Exception as e:
-            logger.error(f"Audit handler error: {e}")
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(self._run_prometheus_server())
+                tg.create_task(self._flush_events_loop())
+                tg.create_task(self._subscribe_br_events())
+        except* Exception as eg:
+            for e in eg.exceptions:
+                logger.error(f"Audit handler error: {e}")
         finally:
+            # Let queued log writes finish before closing the file: the
+            # writer thread is FIFO, so a no-op runs after all of them
+            await asyncio.get_running_loop().run_in_executor(self._io_executor, int)
             await self._close_log_file()
+            if self._http is not None:
+                await self._http.close()
+                self._http = None
 
     def stop(self):
         """Stop the audit handler."""
-        self._running = False
+        self._stop_event.set()
+        self._flush_wakeup.set()
         logger.info("Dataplane Audit stopping")
 
+    def close(self):
+        """Release the log writer thread; the object is unusable afterwards."""
+        self._io_executor.shutdown(wait=False)
+
     async def _open_log_file(self):
         """Open the audit log file."""
         try:
             log_path = Path(self.config.audit_log_path)
             log_path.parent.mkdir(parents=True, exist_ok=True)
-            self._log_file = open(log_path, "a")
+            self._log_file = open(log_path, "ab", buffering=LOG_BUFFER_SIZE)
             logger.info(f"Audit log opened: {log_path}")
         except Exception as e:
             logger.error(f"Failed to open audit log: {e}")
@@ -366,48 +513,81 @@ class DataplaneAudit:
     async def record_event(self, event: AuditEvent):
         """Record an audit event."""
         # Check severity filter
-        severity_order = [s.value for s in AuditSeverity]
-        if severity_order.index(event.severity.value) < severity_order.index(self.config.min_severity.value):
+        if SEVERITY_RANK[event.severity] < SEVERITY_RANK[self.config.min_severity]:
             if not self.config.log_all_events:
                 return
 
         # Update metrics
         self.metrics.record_event(event)
 
-        # Add to buffer
-        self._event_buffer.append(event)
-
-        # Log high-severity events immediately
-        if event.severity in (AuditSeverity.ERROR, AuditSeverity.CRITICAL):
-            await self._send_to_judge_luci(event)
+        # Add to buffer, counting the event as dropped when full
+        try:
+            self._queue.put_nowait(event)
+            queued = True
+        except asyncio.QueueFull:
+            self.metrics.events_dropped += 1
+            queued = False
+
+        # Log high-severity events immediately, riding the next batch if it
+        # is close and the event made it into the buffer
+        if event.severity in HIGH_SEVERITIES:
+            flush_soon = self._next_flush - time.monotonic() <= self.config.flush_interval_seconds / 2
+            if queued and flush_soon:
+                self._flush_wakeup.set()
+            else:
+                await self._send_to_judge_luci(event)
 
         logger.debug(f"Audit event: {event.event_type.value} ({event.severity.value})")
 
     async def _flush_events_loop(self):
         """Periodically flush events to disk and Judge Luci."""
-        while self._running:
-            await asyncio.sleep(self.config.flush_interval_seconds)
-            await self._flush_events()
+        try:
+            while not self._stop_event.is_set():
+                self._next_flush = time.monotonic() + self.config.flush_interval_seconds
+                try:
+                    await asyncio.wait_for(self._flush_wakeup.wait(), self.config.flush_interval_seconds)
+                except asyncio.TimeoutError:
+                    pass
+                self._flush_wakeup.clear()
+                await self._flush_events()
+        finally:
+            self._next_flush = float("inf")
 
     async def _flush_events(self):
         """Flush buffered events."""
-        if not self._event_buffer:
+        if self._queue.empty():
             return
 
-        events_to_flush = list(self._event_buffer)
-        self._event_buffer.clear()
-
-        # Write to log file
-        if self._log_file:
-            for event in events_to_flush:
-                self._log_file.write(json.dumps(event.to_dict()) + "\n")
-            self._log_file.flush()
+        # Drain what is queued now; later events wait for the next flush
+        events_to_flush = []
+        while not self._queue.empty():
+            events_to_flush.append(self._queue.get_nowait())
+
+        # Encode on the loop, which owns the events (to_dict shares their
+        # metadata and caches the ISO timestamp); the audit-io thread only
+        # gets bytes to join and write
+        blobs = [json_dumps(event.to_dict()) for event in events_to_flush]
+        body = await asyncio.get_running_loop().run_in_executor(
+            self._io_executor, self._write_blob, blobs
+        )
 
-        # Batch send to Judge Luci
-        await self._batch_send_to_judge_luci(events_to_flush)
+        # Batch send the same encoded events to Judge Luci
+        await self._batch_send_to_judge_luci(body)
 
         logger.debug(f"Flushed {len(events_to_flush)} audit events")
 
+    def _write_blob(self, blobs: List[bytes]) -> bytes:
+        """
+        Append encoded events to the audit log in one write.
+
+        Returns:
+            Batch request body wrapping the same encoded events
+        """
+        if self._log_file:
+            self._log_file.write(b"\n".join(blobs) + b"\n")
+            self._log_file.flush()
+        return _batch_body(blobs)
+
     async def _send_to_judge_luci(self, event: AuditEvent):
         """Send single event to Judge Luci."""
         try:
@@ -417,19 +597,20 @@ class DataplaneAudit:
             # Fall back to HTTP
             await self._send_via_http(event)
 
-    async def _batch_send_to_judge_luci(self, events: List[AuditEvent]):
-        """Send batch of events to Judge Luci."""
+    async def _batch_send_to_judge_luci(self, body: bytes):
+        """Send batch of already-encoded events to Judge Luci."""
+        if self._http is None:
+            return
+
         try:
             # HTTP batch endpoint
-            import aiohttp
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.config.judge_luci_http}/batch",
-                    json={"events": [e.to_dict() for e in events]},
-                    timeout=aiohttp.ClientTimeout(total=5),
-                ) as resp:
-                    if resp.status != 200:
-                        logger.warning(f"Judge Luci batch send failed: {resp.status}")
+            async with self._http_sem, self._http.post(
+                f"{self.config.judge_luci_http}/batch",
+                data=body,
+                headers=JSON_HEADERS,
+            ) as resp:
+                if resp.status != 200:
+                    logger.warning(f"Judge Luci batch send failed: {resp.status}")
         except Exception as e:
             logger.debug(f"Failed to send to Judge Luci: {e}")
 
@@ -440,15 +621,17 @@ class DataplaneAudit:
 
     async def _send_via_http(self, event: AuditEvent):
         """Send event via HTTP."""
+        if self._http is None:
+            return
+
         try:
-            import aiohttp
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.config.judge_luci_http,
-                    json=event.to_dict(),
-                    timeout=aiohttp.ClientTimeout(total=2),
-                ) as resp:
-                    pass
+            async with self._http_sem, self._http.post(
+                self.config.judge_luci_http,
+                data=json_dumps(event.to_dict()),
+                headers=JSON_HEADERS,
+                timeout=aiohttp.ClientTimeout(total=2),
+            ) as resp:
+                pass
         except Exception:
             pass
 
@@ -456,38 +639,37 @@ class DataplaneAudit:
         """Subscribe to Border Router events."""
         # In production, this would subscribe to BR event stream
         # For now, we accept events via record_event()
-        while self._running:
-            await asyncio.sleep(10)
+        await self._stop_event.wait()
 
     async def _run_prometheus_server(self):
         """Run Prometheus metrics endpoint."""
-        try:
-            from aiohttp import web
+        if web is None:
+            logger.warning("aiohttp not available, Prometheus metrics disabled")
+            return
 
-            async def metrics_handler(request):
-                return web.Response(
-                    text=self.metrics.to_prometheus(),
-                    content_type="text/plain",
-                )
+        async def metrics_handler(request):
+            return web.Response(
+                body=self.metrics.to_prometheus(),
+                content_type="text/plain",
+            )
 
-            async def health_handler(request):
-                return web.Response(text="OK")
+        async def health_handler(request):
+            return web.Response(text="OK")
 
-            app = web.Application()
-            app.router.add_get(self.config.prometheus_path, metrics_handler)
-            app.router.add_get("/health", health_handler)
+        app = web.Application()
+        app.router.add_get(self.config.prometheus_path, metrics_handler)
+        app.router.add_get("/health", health_handler)
 
-            runner = web.AppRunner(app)
-            await runner.setup()
+        runner = web.AppRunner(app)
+        await runner.setup()
+        try:
             site = web.TCPSite(runner, "0.0.0.0", self.config.prometheus_port)
             await site.start()
             logger.info(f"Audit metrics at :{self.config.prometheus_port}{self.config.prometheus_path}")
 
-            while self._running:
-                await asyncio.sleep(1)
-
-        except ImportError:
-            logger.warning("aiohttp not available, Prometheus metrics disabled")
+            await self._stop_event.wait()
+        finally:
+            await runner.cleanup()
 
     # Event creation helpers
     def create_coherence_violation_event(
@@ -499,16 +681,13 @@ class DataplaneAudit:
         metadata: dict = None,
     ) -> AuditEvent:
         """Create a coherence violation event."""
-        src_isd = int(source_isd_as.split("-")[0])
-        dst_isd = int(dest_isd_as.split("-")[0])
-
         return AuditEvent(
             event_type=AuditEventType.COHERENCE_VIOLATION,
             severity=AuditSeverity.WARNING,
             source_isd_as=source_isd_as,
             destination_isd_as=dest_isd_as,
-            source_tier=get_tier_from_isd(src_isd),
-            destination_tier=get_tier_from_isd(dst_isd),
+            source_tier=_isd_tier(source_isd_as)[1],
+            destination_tier=_isd_tier(dest_isd_as)[1],
             coherence_score=coherence,
             coherence_threshold=threshold,
             metadata=metadata or {},
@@ -540,7 +719,7 @@ class DataplaneAudit:
             source_isd_as=source_isd_as,
             destination_isd_as=dest_isd_as,
             source_tier="PAC",
-            destination_tier=get_tier_from_isd(int(dest_isd_as.split("-")[0])),
+            destination_tier=_isd_tier(dest_isd_as)[1],
             pac_consent_status=consent_status,
             cbb_did_hash=cbb_did_hash,
             sbb_did_hash=sbb_did_hash,
@@ -560,8 +739,8 @@ class DataplaneAudit:
             severity=AuditSeverity.ERROR,
             source_isd_as=source_isd_as,
             destination_isd_as=dest_isd_as,
-            source_tier=get_tier_from_isd(int(source_isd_as.split("-")[0])),
-            destination_tier=get_tier_from_isd(int(dest_isd_as.split("-")[0])),
+            source_tier=_isd_tier(source_isd_as)[1],
+            destination_tier=_isd_tier(dest_isd_as)[1],
             waypoint_present=False,
             metadata={**(metadata or {}), "expected_waypoint": expected_waypoint},
         )
@@ -609,6 +788,8 @@ async def main():
         await audit.start()
     except KeyboardInterrupt:
         audit.stop()
+    finally:
+        audit.close()
 
 
 if __name__ == "__main__":
@@ -23,18 +23,21 @@ Per SPIFFE SVID specification:
 """
 
 import asyncio
+import functools
 import hashlib
 import hmac
 import json
 import logging
 import os
+import secrets
 import struct
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 # Logging setup
 logging.basicConfig(
@@ -49,6 +52,15 @@ SPIFFE_TRUST_DOMAIN = "luciverse.ownid"
 KEY_LIFETIME_SECONDS = 900  # 15 minutes
 ROTATION_GRACE_SECONDS = 60  # Start rotation 1 minute before expiry
 
+_GENESIS_BOND_BYTES = GENESIS_BOND_ID.encode()
+_GENESIS_BOND_PREFIX = _GENESIS_BOND_BYTES + b":"
+
+
+@functools.lru_cache(maxsize=4096)
+def _master_key(src_isd_as: str, dst_isd_as: str) -> bytes:
+    """SHA-256 of "<genesis bond>:<src>:<dst>", stable for the process lifetime."""
+    return hashlib.sha256(_GENESIS_BOND_PREFIX + f"{src_isd_as}:{dst_isd_as}".encode()).digest()
+
 
 class KeyTier(Enum):
     """Key derivation tiers matching LuciVerse architecture."""
@@ -106,6 +118,8 @@ class SVID:
     not_after: float
     serial_number: str
     tier: KeyTier = KeyTier.COMN
+    _cached_hash: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _cached_hash_bytes: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def is_valid(self) -> bool:
@@ -124,9 +138,17 @@ class SVID:
         return self.remaining_seconds < ROTATION_GRACE_SECONDS
 
     def compute_hash(self) -> str:
-        """Compute hash of SVID for binding to DRKey."""
-        data = f"{self.spiffe_id}:{self.serial_number}:{self.not_before}"
-        return hashlib.sha256(data.encode()).hexdigest()[:16]
+        """Compute hash of SVID for binding to DRKey (cached; an SVID is not modified once issued)."""
+        if self._cached_hash is None:
+            data = f"{self.spiffe_id}:{self.serial_number}:{self.not_before}"
+            self._cached_hash = hashlib.sha256(data.encode()).hexdigest()[:16]
+        return self._cached_hash
+
+    def compute_hash_bytes(self) -> bytes:
+        """SVID hash as ASCII bytes, ready to splice into a DRKey salt."""
+        if self._cached_hash_bytes is None:
+            self._cached_hash_bytes = self.compute_hash().encode()
+        return self._cached_hash_bytes
 
 
 @dataclass
@@ -176,7 +198,13 @@ class DRKeySVIDSync:
         self._running = False
         self._current_svid: Optional[SVID] = None
         self._drkey_cache: Dict[str, DRKeyL3] = {}
+        # Constant salt bytes per (src_isd_as, dst_isd_as, protocol):
+        # the leading prefix and the trailing tier frequency
+        self._key_meta: Dict[Tuple[str, str, str], Tuple[bytes, bytes]] = {}
         self._rotation_lock = asyncio.Lock()
+        # pbkdf2_hmac releases the GIL, so threads derive keys in parallel off the loop.
+        # The pool lives as long as the object; release it with close().
+        self._kdf_pool = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="drkey-kdf")
 
     async def start(self):
         """Start the synchronization service."""
@@ -194,6 +222,10 @@ class DRKeySVIDSync:
         self._running = False
         logger.info("DRKey-SVID synchronization stopping")
 
+    def close(self):
+        """Release the key-derivation threads; the object is unusable afterwards."""
+        self._kdf_pool.shutdown(wait=False, cancel_futures=True)
+
     async def _sync_loop(self):
         """Main synchronization loop."""
         while self._running:
@@ -213,10 +245,10 @@ class DRKeySVIDSync:
                 await self._rotate_svid()
 
             # Check DRKeys
-            for key_id, drkey in list(self._drkey_cache.items()):
-                if drkey.needs_rotation:
-                    logger.info(f"DRKey rotation needed: {key_id}")
-                    await self._rotate_drkey(key_id)
+            expiring = [key_id for key_id, drkey in self._drkey_cache.items() if drkey.needs_rotation]
+            if expiring:
+                logger.info(f"DRKey rotation needed: {', '.join(expiring)}")
+                await self._rotate_drkeys(expiring)
 
     async def _fetch_svid(self):
         """Fetch current SVID from SPIFFE Workload API."""
@@ -231,7 +263,7 @@ class DRKeySVIDSync:
                 private_key_pem="",  # Would be actual key
                 not_before=now,
                 not_after=now + self.config.key_lifetime,
-                serial_number=hashlib.sha256(str(now).encode()).hexdigest()[:16],
+                serial_number=secrets.token_hex(8),
                 tier=KeyTier.COMN,
             )
             logger.info(f"SVID fetched: {self._current_svid.spiffe_id}")
@@ -247,27 +279,24 @@ class DRKeySVIDSync:
             return
 
         # Rotate all DRKeys with new SVID binding
-        for key_id in list(self._drkey_cache.keys()):
-            await self._rotate_drkey(key_id)
+        await self._rotate_drkeys(list(self._drkey_cache.keys()))
 
         logger.info("SVID rotation complete, DRKeys updated")
 
-    async def _rotate_drkey(self, key_id: str):
-        """Rotate a specific DRKey."""
-        if key_id not in self._drkey_cache:
+    async def _rotate_drkeys(self, key_ids: List[str]):
+        """Rotate the given DRKeys as one batch."""
+        key_ids = [key_id for key_id in key_ids if key_id in self._drkey_cache]
+        if not key_ids:
             return
 
-        old_key = self._drkey_cache[key_id]
-
-        # Derive new key
-        new_key = await self._derive_drkey_l3(
-            src_isd_as=old_key.src_isd_as,
-            dst_isd_as=old_key.dst_isd_as,
-            protocol=old_key.protocol,
+        old_keys = [self._drkey_cache[key_id] for key_id in key_ids]
+        new_keys = await self._batch_derive_drkeys(
+            [(old.src_isd_as, old.dst_isd_as, old.protocol) for old in old_keys]
         )
 
-        self._drkey_cache[key_id] = new_key
-        logger.debug(f"DRKey rotated: {key_id}")
+        for key_id, new_key in zip(key_ids, new_keys):
+            self._drkey_cache[key_id] = new_key
+            logger.debug(f"DRKey rotated: {key_id}")
 
     async def _derive_drkey_l3(
         self,
@@ -281,54 +310,79 @@ class DRKeySVIDSync:
         The key derivation includes SVID hash in the salt,
         cryptographically binding SCION and SPIFFE identities.
         """
-        now = time.time()
+        return (await self._batch_derive_drkeys([(src_isd_as, dst_isd_as, protocol)]))[0]
 
-        # Build salt with SVID binding
-        salt_parts = [
-            f"LuciVerse-DRKey-L3",
-            src_isd_as,
-            dst_isd_as,
-            protocol,
-            str(int(now / self.config.key_lifetime)),  # Time bucket
-        ]
+    async def _batch_derive_drkeys(
+        self,
+        items: List[Tuple[str, str, str]],
+    ) -> List[DRKeyL3]:
+        """
+        Derive DRKey Level 3 keys for (src_isd_as, dst_isd_as, protocol) items.
 
-        if self.config.genesis_bond_in_salt:
-            salt_parts.append(GENESIS_BOND_ID)
+        All keys in a batch share one timestamp, time bucket and SVID hash.
+        """
+        now = time.time()
+        bucket = b"%d" % int(now / self.config.key_lifetime)  # Time bucket
+        svid_hash = self._current_svid.compute_hash() if self._current_svid else ""
 
+        # Salt parts shared by the whole batch, after the time bucket
+        shared_parts = [bucket]
+        if self.config.genesis_bond_in_salt:
+            shared_parts.append(_GENESIS_BOND_BYTES)
         if self._current_svid:
-            salt_parts.append(self._current_svid.compute_hash())
-            svid_hash = self._current_svid.compute_hash()
-        else:
-            svid_hash = ""
-
-        # Determine tier and add frequency
-        tier = self._get_tier_from_isd_as(src_isd_as)
-        frequency = self.config.tier_frequencies.get(tier, 528)
-        salt_parts.append(f"{frequency}Hz")
-
-        salt = ":".join(salt_parts).encode()
-
-        # Master key (in production, would come from DRKey L2)
-        master_key = self._get_master_key(src_isd_as, dst_isd_as)
-
-        # Derive key using PBKDF2
-        key = self._pbkdf2_derive(
-            password=master_key,
-            salt=salt,
-            iterations=self.config.kdf_iterations,
-            key_length=32,
-        )
+            shared_parts.append(self._current_svid.compute_hash_bytes())
+        shared = b":".join(shared_parts)
+
+        kdf_args = []
+        for item in items:
+            src_isd_as, dst_isd_as, protocol = item
+
+            # Build salt with SVID binding
+            meta = self._key_meta.get(item)
+            if meta is None:
+                # Determine tier and add frequency
+                tier = self._get_tier_from_isd_as(src_isd_as)
+                frequency = self.config.tier_frequencies.get(tier, 528)
+                meta = self._key_meta[item] = (
+                    f"LuciVerse-DRKey-L3:{src_isd_as}:{dst_isd_as}:{protocol}:".encode(),
+                    f":{frequency}Hz".encode(),
+                )
+            salt_prefix, freq_suffix = meta
+
+            salt = salt_prefix + shared + freq_suffix
+
+            # Master key (in production, would come from DRKey L2)
+            master_key = self._get_master_key(src_isd_as, dst_isd_as)
+
+            kdf_args.append((master_key, salt))
+
+        # Derive keys using PBKDF2, one pool thread per key
+        loop = asyncio.get_running_loop()
+        derived = await asyncio.gather(*[
+            loop.run_in_executor(
+                self._kdf_pool,
+                self._pbkdf2_derive,
+                master_key,
+                salt,
+                self.config.kdf_iterations,
+                32,
+            )
+            for master_key, salt in kdf_args
+        ])
 
-        return DRKeyL3(
-            key=key,
-            src_isd_as=src_isd_as,
-            dst_isd_as=dst_isd_as,
-            protocol=protocol,
-            validity_start=now,
-            validity_end=now + self.config.key_lifetime,
-            derived_from_svid=bool(self._current_svid),
-            svid_hash=svid_hash,
-        )
+        return [
+            DRKeyL3(
+                key=key,
+                src_isd_as=src_isd_as,
+                dst_isd_as=dst_isd_as,
+                protocol=protocol,
+                validity_start=now,
+                validity_end=now + self.config.key_lifetime,
+                derived_from_svid=bool(self._current_svid),
+                svid_hash=svid_hash,
+            )
+            for (src_isd_as, dst_isd_as, protocol), key in zip(items, derived)
+        ]
 
     def _get_master_key(self, src_isd_as: str, dst_isd_as: str) -> bytes:
         """
@@ -337,8 +391,7 @@ class DRKeySVIDSync:
         In production, this would come from SCION DRKey L2.
         Here we derive from Genesis Bond for consistency.
         """
-        data = f"{GENESIS_BOND_ID}:{src_isd_as}:{dst_isd_as}"
-        return hashlib.sha256(data.encode()).digest()
+        return _master_key(src_isd_as, dst_isd_as)
 
     def _pbkdf2_derive(
         self,
@@ -348,7 +401,7 @@ class DRKeySVIDSync:
         key_length: int,
     ) -> bytes:
         """Derive key using PBKDF2-SHA256."""
-        import hashlib
+        # OpenSSL-backed; picks SHA-NI/AVX2 SHA-256 itself via CPUID dispatch
         return hashlib.pbkdf2_hmac(
             "sha256",
             password,
@@ -446,6 +499,8 @@ async def main():
         await sync.start()
     except KeyboardInterrupt:
         sync.stop()
+    finally:
+        sync.close()
 
 
 if __name__ == "__main__":
@@ -32,7 +32,7 @@ import socket
 import struct
 import sys
 import time
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from enum import Enum
 from pathlib import Path
 from typing import Dict, Optional, Tuple
@@ -42,18 +42,21 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "lib"))
 
 try:
     from luciverse_scion import (
+        SCIONHeader,
         GenesisBondExtension,
         PACPrivacyExtension,
-        extract_genesis_bond_from_packet,
+        GENESIS_BOND_NEXTHDR,
+        GENESIS_BOND_OPTTYPE,
+        PAC_PRIVACY_OPTTYPE,
         TIER_COHERENCE,
         TIER_FREQUENCIES,
         get_tier_from_isd,
     )
-    from luciverse_scion.pac_privacy_ext import extract_pac_privacy_from_packet
 except ImportError:
     # Fallback for standalone testing
     logging.warning("luciverse_scion not found, using minimal implementation")
     GenesisBondExtension = None
+    PACPrivacyExtension = None
 
 # Configuration
 GENESIS_BOND_ID = "GB-2025-0524-DRH-LCS-001"
@@ -68,6 +71,42 @@ logging.basicConfig(
 logger = logging.getLogger("sig-genesis-handler")
 
 
+def _find_extensions(packet: bytes) -> Tuple[Optional[bytes], Optional[bytes]]:
+    """
+    Parse the SCION header once and return the raw Genesis Bond and
+    PAC Privacy extension blocks (either may be None).
+
+    Matches extract_genesis_bond_from_packet / extract_pac_privacy_from_packet,
+    which would each parse the full header again.
+    """
+    try:
+        extensions = SCIONHeader.parse(packet).extensions
+    except Exception:
+        return None, None
+
+    genesis_data = pac_data = None
+    for ext_data in extensions:
+        if len(ext_data) < 4:
+            continue
+        opt_type = ext_data[2]
+        if genesis_data is None and opt_type == GENESIS_BOND_OPTTYPE and ext_data[0] == GENESIS_BOND_NEXTHDR:
+            genesis_data = ext_data
+        if pac_data is None and opt_type == PAC_PRIVACY_OPTTYPE:
+            pac_data = ext_data
+    return genesis_data, pac_data
+
+
+def _parse_extension(ext_cls, ext_data: Optional[bytes]):
+    """Parse a raw extension block, or None if absent or malformed."""
+    if ext_data is None:
+        return None
+    try:
+        ext, _ = ext_cls.parse(ext_data)
+        return ext
+    except Exception:
+        return None
+
+
 class ValidationResult(Enum):
     """Validation result codes."""
     VALID = "valid"
@@ -120,72 +159,111 @@ class HandlerConfig:
             return cls()
 
 
+# Prometheus exposition for ValidationMetrics, filled with one %-format per scrape
+PROM_TEMPLATE = (
+    "# HELP luciverse_sig_packets_total Total packets processed\n"
+    "# TYPE luciverse_sig_packets_total counter\n"
+    'luciverse_sig_packets_total{status="processed"} %d\n'
+    'luciverse_sig_packets_total{status="valid"} %d\n'
+    'luciverse_sig_packets_total{status="invalid"} %d\n'
+    "\n"
+    "# HELP luciverse_sig_validation_failures_total Validation failures by type\n"
+    "# TYPE luciverse_sig_validation_failures_total counter\n"
+    'luciverse_sig_validation_failures_total{type="coherence"} %d\n'
+    'luciverse_sig_validation_failures_total{type="genesis_bond"} %d\n'
+    'luciverse_sig_validation_failures_total{type="frequency"} %d\n'
+    'luciverse_sig_validation_failures_total{type="missing_extension"} %d\n'
+    'luciverse_sig_validation_failures_total{type="pac_consent"} %d\n'
+    'luciverse_sig_validation_failures_total{type="parse_error"} %d\n'
+    "\n"
+    "# HELP luciverse_sig_coherence_average Average coherence score\n"
+    "# TYPE luciverse_sig_coherence_average gauge\n"
+    "luciverse_sig_coherence_average %.4f\n"
+)
+
+
 @dataclass
 class ValidationMetrics:
     """Metrics for monitoring."""
     packets_processed: int = 0
-    packets_valid: int = 0
-    packets_invalid: int = 0
-    coherence_failures: int = 0
-    genesis_bond_failures: int = 0
-    frequency_failures: int = 0
-    missing_extension: int = 0
-    pac_consent_denied: int = 0
-    parse_errors: int = 0
-    avg_coherence: float = 0.0
+    results: Dict[ValidationResult, int] = field(
+        default_factory=lambda: dict.fromkeys(ValidationResult, 0)
+    )
     _coherence_sum: float = 0.0
     _coherence_count: int = 0
 
+    # Named counters, read from the per-result counts
+    @property
+    def packets_valid(self) -> int:
+        return self.results[ValidationResult.VALID]
+
+    @property
+    def packets_invalid(self) -> int:
+        return self.packets_processed - self.results[ValidationResult.VALID]
+
+    @property
+    def coherence_failures(self) -> int:
+        return self.results[ValidationResult.INVALID_COHERENCE]
+
+    @property
+    def genesis_bond_failures(self) -> int:
+        return self.results[ValidationResult.INVALID_GENESIS_BOND]
+
+    @property
+    def frequency_failures(self) -> int:
+        return self.results[ValidationResult.INVALID_FREQUENCY]
+
+    @property
+    def missing_extension(self) -> int:
+        return self.results[ValidationResult.MISSING_EXTENSION]
+
+    @property
+    def pac_consent_denied(self) -> int:
+        return self.results[ValidationResult.PAC_CONSENT_DENIED]
+
+    @property
+    def parse_errors(self) -> int:
+        return self.results[ValidationResult.PARSE_ERROR]
+
+    @property
+    def avg_coherence(self) -> float:
+        """Mean recorded coherence, computed when read."""
+        if not self._coherence_count:
+            return 0.0
+        return self._coherence_sum / self._coherence_count
+
     def record_validation(self, result: ValidationResult, coherence: Optional[float] = None):
         """Record a validation result."""
         self.packets_processed += 1
-
-        if result == ValidationResult.VALID:
-            self.packets_valid += 1
-        else:
-            self.packets_invalid += 1
-
-        if result == ValidationResult.INVALID_COHERENCE:
-            self.coherence_failures += 1
-        elif result == ValidationResult.INVALID_GENESIS_BOND:
-            self.genesis_bond_failures += 1
-        elif result == ValidationResult.INVALID_FREQUENCY:
-            self.frequency_failures += 1
-        elif result == ValidationResult.MISSING_EXTENSION:
-            self.missing_extension += 1
-        elif result == ValidationResult.PAC_CONSENT_DENIED:
-            self.pac_consent_denied += 1
-        elif result == ValidationResult.PARSE_ERROR:
-            self.parse_errors += 1
+        self.results[result] += 1
+
+        # Log periodic status
+        if self.packets_processed % 1000 == 0:
+            logger.info(
+                f"Processed {self.packets_processed} packets "
+                f"({self.packets_valid} valid, "
+                f"avg coherence: {self.avg_coherence:.3f})"
+            )
 
         if coherence is not None:
             self._coherence_sum += coherence
             self._coherence_count += 1
-            self.avg_coherence = self._coherence_sum / self._coherence_count
 
     def to_prometheus(self) -> str:
         """Format metrics for Prometheus."""
-        lines = [
-            "# HELP luciverse_sig_packets_total Total packets processed",
-            "# TYPE luciverse_sig_packets_total counter",
-            f"luciverse_sig_packets_total{{status=\"processed\"}} {self.packets_processed}",
-            f"luciverse_sig_packets_total{{status=\"valid\"}} {self.packets_valid}",
-            f"luciverse_sig_packets_total{{status=\"invalid\"}} {self.packets_invalid}",
-            "",
-            "# HELP luciverse_sig_validation_failures_total Validation failures by type",
-            "# TYPE luciverse_sig_validation_failures_total counter",
-            f"luciverse_sig_validation_failures_total{{type=\"coherence\"}} {self.coherence_failures}",
-            f"luciverse_sig_validation_failures_total{{type=\"genesis_bond\"}} {self.genesis_bond_failures}",
-            f"luciverse_sig_validation_failures_total{{type=\"frequency\"}} {self.frequency_failures}",
-            f"luciverse_sig_validation_failures_total{{type=\"missing_extension\"}} {self.missing_extension}",
-            f"luciverse_sig_validation_failures_total{{type=\"pac_consent\"}} {self.pac_consent_denied}",
-            f"luciverse_sig_validation_failures_total{{type=\"parse_error\"}} {self.parse_errors}",
-            "",
-            "# HELP luciverse_sig_coherence_average Average coherence score",
-            "# TYPE luciverse_sig_coherence_average gauge",
-            f"luciverse_sig_coherence_average {self.avg_coherence:.4f}",
-        ]
-        return "\n".join(lines) + "\n"
+        results = self.results
+        return PROM_TEMPLATE % (
+            self.packets_processed,
+            results[ValidationResult.VALID],
+            self.packets_invalid,
+            results[ValidationResult.INVALID_COHERENCE],
+            results[ValidationResult.INVALID_GENESIS_BOND],
+            results[ValidationResult.INVALID_FREQUENCY],
+            results[ValidationResult.MISSING_EXTENSION],
+            results[ValidationResult.PAC_CONSENT_DENIED],
+            results[ValidationResult.PARSE_ERROR],
+            self.avg_coherence,
+        )
 
 
 class GenesisHandler:
@@ -199,7 +277,12 @@ class GenesisHandler:
     def __init__(self, config: HandlerConfig):
         self.config = config
         self.metrics = ValidationMetrics()
-        self._running = False
+        self._stop_event = asyncio.Event()
+
+        # Header names, formatted once rather than per packet
+        self._hdr_present = f"{config.header_prefix}-Present"
+        self._hdr_coherence = f"{config.header_prefix}-Coherence"
+        self._hdr_valid = f"{config.header_prefix}-Valid"
 
         # Set log level
         logger.setLevel(getattr(logging, config.log_level.upper()))
@@ -217,16 +300,20 @@ class GenesisHandler:
         http_headers = {}
 
         try:
-            # Extract Genesis Bond extension
-            genesis = extract_genesis_bond_from_packet(packet) if GenesisBondExtension else None
+            # Extract Genesis Bond (and raw PAC Privacy) extension from one header parse
+            if GenesisBondExtension:
+                genesis_data, pac_data = _find_extensions(packet)
+                genesis = _parse_extension(GenesisBondExtension, genesis_data)
+            else:
+                genesis = pac_data = None
 
             if genesis is None:
                 if self.config.require_genesis_bond:
                     self.metrics.record_validation(ValidationResult.MISSING_EXTENSION)
                     return ValidationResult.MISSING_EXTENSION, None
                 # No extension but not required - allow with default headers
-                http_headers[f"{self.config.header_prefix}-Present"] = "false"
-                http_headers[f"{self.config.header_prefix}-Coherence"] = "0.75"  # Default
+                http_headers[self._hdr_present] = "false"
+                http_headers[self._hdr_coherence] = "0.75"  # Default
                 self.metrics.record_validation(ValidationResult.VALID)
                 return ValidationResult.VALID, http_headers
 
@@ -247,7 +334,7 @@ class GenesisHandler:
                 return ValidationResult.INVALID_FREQUENCY, None
 
             # Check PAC privacy if present
-            pac_privacy = extract_pac_privacy_from_packet(packet) if PACPrivacyExtension else None
+            pac_privacy = _parse_extension(PACPrivacyExtension, pac_data) if PACPrivacyExtension else None
             if pac_privacy is not None:
                 consent_valid, reason = pac_privacy.validate_consent()
                 if not consent_valid:
@@ -260,7 +347,7 @@ class GenesisHandler:
 
             # Build HTTP headers for Envoy
             http_headers.update(genesis.to_http_headers())
-            http_headers[f"{self.config.header_prefix}-Valid"] = "true"
+            http_headers[self._hdr_valid] = "true"
 
             self.metrics.record_validation(ValidationResult.VALID, coherence)
             return ValidationResult.VALID, http_headers
@@ -344,7 +431,7 @@ class GenesisHandler:
 
     async def run(self):
         """Run the Genesis Handler."""
-        self._running = True
+        self._stop_event.clear()
         logger.info(f"Genesis Handler starting (threshold: {self.config.coherence_threshold})")
 
         # Start Prometheus server
@@ -353,21 +440,12 @@ class GenesisHandler:
         except ImportError:
             logger.warning("aiohttp not available, Prometheus metrics disabled")
 
-        # Main loop - in practice would integrate with SIG
-        while self._running:
-            await asyncio.sleep(1)
-
-            # Log periodic status
-            if self.metrics.packets_processed > 0 and self.metrics.packets_processed % 1000 == 0:
-                logger.info(
-                    f"Processed {self.metrics.packets_processed} packets "
-                    f"({self.metrics.packets_valid} valid, "
-                    f"avg coherence: {self.metrics.avg_coherence:.3f})"
-                )
+        # Idle until stopped - in practice would integrate with SIG
+        await self._stop_event.wait()
 
     def stop(self):
         """Stop the handler."""
-        self._running = False
+        self._stop_event.set()
         logger.info("Genesis Handler stopping")
 
 
@@ -30,6 +30,9 @@ from .scion_header import NextHeader
 GENESIS_BOND_NEXTHDR = 200  # Hop-by-hop extension
 GENESIS_BOND_OPTTYPE = 0x47  # 'G' in ASCII, indicates Genesis Bond option
 
+# Extension header (4 bytes) + tier, coherence, frequency, bond ID, timestamp (16 bytes)
+_GENESIS_BOND_EXT = struct.Struct(">BBBBBBH8sI")
+
 # Genesis Bond ID constant
 GENESIS_BOND_ID = "GB-2025-0524-DRH-LCS-001"
 
@@ -191,17 +194,15 @@ class GenesisBondExtension:
         if len(data) < 20:
             raise ValueError(f"Insufficient data for Genesis Bond extension: {len(data)} < 20")
 
-        # Parse standard extension header (4 bytes)
-        next_hdr, ext_len, opt_type, opt_len = struct.unpack(">BBBB", data[0:4])
+        # Standard extension header (4 bytes) and Genesis Bond data (16 bytes)
+        (
+            next_hdr, ext_len, opt_type, opt_len,
+            tier_type, coherence, frequency, bond_id, timestamp,
+        ) = _GENESIS_BOND_EXT.unpack_from(data)
 
         if opt_type != GENESIS_BOND_OPTTYPE:
             raise ValueError(f"Invalid option type: 0x{opt_type:02X} != 0x{GENESIS_BOND_OPTTYPE:02X}")
 
-        # Parse Genesis Bond data (16 bytes)
-        tier_type, coherence, frequency = struct.unpack(">BBH", data[4:8])
-        bond_id = data[8:16]
-        timestamp = struct.unpack(">I", data[16:20])[0]
-
         ext_total_len = (ext_len + 1) * 4
 
         return cls(
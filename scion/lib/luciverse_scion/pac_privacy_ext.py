@@ -31,6 +31,9 @@ from .scion_header import NextHeader
 PAC_PRIVACY_NEXTHDR = 201  # End-to-end extension
 PAC_PRIVACY_OPTTYPE = 0x50  # 'P' in ASCII, indicates Privacy option
 
+# Extension header (4 bytes) + flags, consent, 2 reserved, CBB DID, SBB DID (20 bytes)
+_PAC_PRIVACY_EXT = struct.Struct(">BBBBBB2x8s8s")
+
 # Default DID values from Genesis Bond
 DEFAULT_CBB_DID = "did:lucidigital:daryl"
 DEFAULT_SBB_DID = "did:lucidigital:lucia"
@@ -252,18 +255,15 @@ class PACPrivacyExtension:
         if len(data) < 24:
             raise ValueError(f"Insufficient data for PAC Privacy extension: {len(data)} < 24")
 
-        # Parse standard extension header (4 bytes)
-        next_hdr, ext_len, opt_type, opt_len = struct.unpack(">BBBB", data[0:4])
+        # Standard extension header (4 bytes) and Privacy data (20 bytes)
+        (
+            next_hdr, ext_len, opt_type, opt_len,
+            flags, consent, cbb_did, sbb_did,
+        ) = _PAC_PRIVACY_EXT.unpack_from(data)
 
         if opt_type != PAC_PRIVACY_OPTTYPE:
             raise ValueError(f"Invalid option type: 0x{opt_type:02X} != 0x{PAC_PRIVACY_OPTTYPE:02X}")
 
-        # Parse Privacy data
-        flags, consent = struct.unpack(">BB", data[4:6])
-        # Skip 2 reserved bytes
-        cbb_did = data[8:16]
-        sbb_did = data[16:24]
-
         ext_total_len = (ext_len + 1) * 4
 
         return cls(
@@ -23,6 +23,13 @@ from dataclasses import dataclass, field
 from enum import IntEnum
 from typing import List, Optional, Tuple
 
+# Precompiled wire formats (parsed with unpack_from, no per-call format lookup)
+_COMMON_HDR = struct.Struct(">IBBHBB")  # Word0 | NextHdr HdrLen PayLen | PathType AddrInfo
+_ISD_AS = struct.Struct(">HHI")         # ISD | AS high 16 bits | AS low 32 bits
+_PATH_META = struct.Struct(">I")
+_INFO_FIELD = struct.Struct(">BBHI")
+_HOP_FIELD = struct.Struct(">BBHH")     # Followed by the 6-byte MAC
+
 
 class NextHeader(IntEnum):
     """SCION Next Header values (Section 3.1)."""
@@ -83,16 +90,13 @@ class CommonHeader:
             raise ValueError("Insufficient data for common header")
 
         # First 4 bytes: Version(4) | TrafficClass(8) | FlowID(20)
-        word0 = struct.unpack(">I", data[0:4])[0]
+        # Second 4 bytes: NextHdr(8) | HdrLen(8) | PayLen(16)
+        # Third 4 bytes: PathType(8) | DT(2) | DL(2) | ST(2) | SL(2) | Reserved(16)
+        word0, next_hdr, hdr_len, pay_len, path_type, addr_info = _COMMON_HDR.unpack_from(data)
         version = (word0 >> 28) & 0xF
         traffic_class = (word0 >> 20) & 0xFF
         flow_id = word0 & 0xFFFFF
 
-        # Second 4 bytes: NextHdr(8) | HdrLen(8) | PayLen(16)
-        next_hdr, hdr_len, pay_len = struct.unpack(">BBH", data[4:8])
-
-        # Third 4 bytes: PathType(8) | DT(2) | DL(2) | ST(2) | SL(2) | Reserved(16)
-        path_type, addr_info = struct.unpack(">BB", data[8:10])
         dt = (addr_info >> 6) & 0x3
         dl = (addr_info >> 4) & 0x3
         st = (addr_info >> 2) & 0x3
@@ -151,11 +155,9 @@ class ISDAS:
     @classmethod
     def parse(cls, data: bytes) -> "ISDAS":
         """Parse ISD-AS from 8 bytes."""
-        # ISD-AS: ISD(16 bits) | AS(48 bits)
-        isd = struct.unpack(">H", data[0:2])[0]
-        # AS is 48 bits, stored in big-endian
-        asn = struct.unpack(">Q", b"\x00\x00" + data[2:8])[0]
-        return cls(isd=isd, asn=asn)
+        # ISD-AS: ISD(16 bits) | AS(48 bits), AS stored in big-endian
+        isd, asn_high, asn_low = _ISD_AS.unpack_from(data)
+        return cls(isd=isd, asn=asn_high << 32 | asn_low)
 
     def serialize(self) -> bytes:
         """Serialize ISD-AS to 8 bytes."""
@@ -259,12 +261,12 @@ class InfoField:
     @classmethod
     def parse(cls, data: bytes) -> "InfoField":
         """Parse info field from 8 bytes."""
-        flags, _, seg_id, timestamp = struct.unpack(">BBHI", data[:8])
+        flags, _, seg_id, timestamp = _INFO_FIELD.unpack_from(data)
         return cls(flags=flags, segment_id=seg_id, timestamp=timestamp)
 
     def serialize(self) -> bytes:
         """Serialize info field to 8 bytes."""
-        return struct.pack(">BBHI", self.flags, 0, self.segment_id, self.timestamp)
+        return _INFO_FIELD.pack(self.flags, 0, self.segment_id, self.timestamp)
 
 
 @dataclass
@@ -298,7 +300,7 @@ class HopField:
     @classmethod
     def parse(cls, data: bytes) -> "HopField":
         """Parse hop field from 12 bytes."""
-        flags, exp_time, cons_ingress, cons_egress = struct.unpack(">BBHH", data[:6])
+        flags, exp_time, cons_ingress, cons_egress = _HOP_FIELD.unpack_from(data)
         mac = data[6:12]
         return cls(
             flags=flags,
@@ -310,8 +312,7 @@ class HopField:
 
     def serialize(self) -> bytes:
         """Serialize hop field to 12 bytes."""
-        return struct.pack(
-            ">BBHH",
+        return _HOP_FIELD.pack(
             self.flags,
             self.exp_time,
             self.cons_ingress,
@@ -350,7 +351,7 @@ class PathHeader:
             raise NotImplementedError(f"Path type {path_type} not implemented")
 
         # Parse Path Meta Header (4 bytes)
-        meta = struct.unpack(">I", data[:4])[0]
+        meta = _PATH_META.unpack_from(data)[0]
         curr_inf = (meta >> 30) & 0x3
         curr_hf = (meta >> 24) & 0x3F
         seg0_len = (meta >> 18) & 0x3F
@@ -396,7 +397,7 @@ class PathHeader:
             (self.seg2_len & 0x3F) << 6
         )
 
-        result = struct.pack(">I", meta)
+        result = _PATH_META.pack(meta)
 
         for info in self.info_fields:
             result += info.serialize()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Dataplane Audit Handler
+Genesis Bond: GB-2025-0524-DRH-LCS-001
+
+Tests the bounded event buffer, urgent event delivery to Judge Luci
+and the audit log lifecycle.
+"""
+
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add lib and audit to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "lib"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "audit"))
+
+from dataplane_audit import (
+    AuditConfig,
+    AuditEvent,
+    AuditSeverity,
+    DataplaneAudit,
+)
+
+
+def make_audit(**kwargs) -> DataplaneAudit:
+    """Audit handler whose single-event Judge Luci sends are recorded."""
+    audit = DataplaneAudit(AuditConfig(**kwargs))
+    audit.sent = []
+
+    async def send_to_judge_luci(event):
+        audit.sent.append(event)
+
+    audit._send_to_judge_luci = send_to_judge_luci
+    return audit
+
+
+class TestRecordEvent:
+    """Tests for event buffering and urgent delivery."""
+
+    def test_buffer_overflow_counted(self):
+        """Test events beyond the buffer are counted as dropped."""
+        audit = make_audit(event_buffer_size=2)
+
+        async def run():
+            for i in range(5):
+                await audit.record_event(AuditEvent(event_id=str(i)))
+
+        asyncio.run(run())
+
+        assert audit._queue.qsize() == 2
+        assert audit.metrics.events_dropped == 3
+        assert audit.sent == []
+
+    def test_urgent_event_folded_into_close_flush(self):
+        """Test an urgent event rides the next batch when one is due."""
+        audit = make_audit()
+        audit._next_flush = time.monotonic()
+
+        asyncio.run(audit.record_event(AuditEvent(severity=AuditSeverity.CRITICAL)))
+
+        assert audit._queue.qsize() == 1
+        assert audit._flush_wakeup.is_set()
+        assert audit.sent == []
+
+    def test_urgent_event_sent_when_flush_far(self):
+        """Test an urgent event is sent directly when no flush is close."""
+        audit = make_audit()
+        event = AuditEvent(severity=AuditSeverity.ERROR)
+
+        asyncio.run(audit.record_event(event))
+
+        assert audit.sent == [event]
+        assert not audit._flush_wakeup.is_set()
+
+    def test_urgent_event_sent_when_queue_full(self):
+        """Test an urgent event that could not be buffered is still sent."""
+        audit = make_audit(event_buffer_size=1)
+        audit._next_flush = time.monotonic()
+        urgent = AuditEvent(event_id="urgent", severity=AuditSeverity.CRITICAL)
+
+        async def run():
+            await audit.record_event(AuditEvent(event_id="filler"))
+            await audit.record_event(urgent)
+
+        asyncio.run(run())
+
+        assert audit.metrics.events_dropped == 1
+        assert audit.sent == [urgent]
+
+
+class TestLifecycle:
+    """Tests for start/stop and the audit log writer."""
+
+    def test_restart_writes_log(self, tmp_path):
+        """Test the handler can be started again after a stop."""
+        log_path = tmp_path / "audit.jsonl"
+        audit = make_audit(
+            audit_log_path=str(log_path), flush_interval_seconds=30, prometheus_port=0
+        )
+
+        async def run():
+            for i in range(2):
+                task = asyncio.create_task(audit.start())
+                await asyncio.sleep(0.05)
+                await audit.record_event(AuditEvent(event_id=str(i)))
+                audit.stop()
+                await asyncio.wait_for(task, 5)
+
+        try:
+            asyncio.run(run())
+        finally:
+            audit.close()
+
+        assert len(log_path.read_text().splitlines()) == 2
+
+    def test_flush_hands_writer_bytes(self, tmp_path):
+        """Test events are encoded on the loop before the writer thread runs."""
+        log_path = tmp_path / "audit.jsonl"
+        audit = make_audit(audit_log_path=str(log_path))
+        written = []
+        write_blob = audit._write_blob
+
+        def record_write(blobs):
+            written.extend(blobs)
+            return write_blob(blobs)
+
+        audit._write_blob = record_write
+
+        async def run():
+            await audit._open_log_file()
+            await audit.record_event(AuditEvent(event_id="a", metadata={"k": 1}))
+            await audit._flush_events()
+            await audit._close_log_file()
+
+        try:
+            asyncio.run(run())
+        finally:
+            audit.close()
+
+        assert all(isinstance(blob, bytes) for blob in written)
+        assert json.loads(log_path.read_text())["metadata"] == {"k": 1}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
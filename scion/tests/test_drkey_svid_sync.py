@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for DRKey-SVID Synchronization
+Genesis Bond: GB-2025-0524-DRH-LCS-001
+
+Tests DRKey derivation, batch rotation on SVID renewal and the service
+lifecycle around the shared key-derivation thread pool.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add lib and auth to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "lib"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "auth"))
+
+from drkey_svid_sync import DRKeySVIDSync, SyncConfig
+
+
+@pytest.fixture
+def sync():
+    """Sync service with a cheap KDF and a fast loop."""
+    s = DRKeySVIDSync(SyncConfig(kdf_iterations=1000, sync_interval=0.01))
+    yield s
+    s.close()
+
+
+async def run_once(sync: DRKeySVIDSync):
+    """Start the service, let it rotate, then stop it."""
+    task = asyncio.create_task(sync.start())
+    await asyncio.sleep(0.05)
+    sync.stop()
+    await asyncio.wait_for(task, 5)
+
+
+class TestGetDRKey:
+    """Tests for DRKey derivation."""
+
+    def test_derive_key(self, sync):
+        """Test a derived key is bound to the current SVID."""
+
+        async def run():
+            await sync._fetch_svid()
+            return await sync.get_drkey("1-ff00:0:110", "2-ff00:0:220")
+
+        key = asyncio.run(run())
+
+        assert len(key.key) == 32
+        assert key.derived_from_svid
+
+    def test_cached_key(self, sync):
+        """Test the same key is returned while it is valid."""
+
+        async def run():
+            await sync._fetch_svid()
+            first = await sync.get_drkey("1-ff00:0:110", "2-ff00:0:220")
+            second = await sync.get_drkey("1-ff00:0:110", "2-ff00:0:220")
+            return first, second
+
+        first, second = asyncio.run(run())
+
+        assert first.key == second.key
+
+
+class TestRotation:
+    """Tests for batch DRKey rotation."""
+
+    def test_rotation_rebinds_all_keys(self, sync):
+        """Test an SVID rotation re-derives every cached key in one batch."""
+        pairs = [("1-ff00:0:110", "2-ff00:0:220"), ("2-ff00:0:220", "3-ff00:0:330")]
+
+        async def run():
+            await sync._fetch_svid()
+            before = [await sync.get_drkey(src, dst) for src, dst in pairs]
+            await sync._rotate_svid()
+            after = [await sync.get_drkey(src, dst) for src, dst in pairs]
+            return before, after, sync._current_svid.compute_hash()
+
+        before, after, binding_hash = asyncio.run(run())
+
+        for old, new in zip(before, after):
+            assert new.key != old.key
+            assert new.svid_hash == binding_hash
+            assert (new.src_isd_as, new.dst_isd_as) == (old.src_isd_as, old.dst_isd_as)
+
+    def test_batch_matches_single(self, sync):
+        """Test batch derivation yields the same keys as one-by-one derivation."""
+        requests = [
+            ("1-ff00:0:110", "2-ff00:0:220", "luciverse"),
+            ("3-ff00:0:1", "1-ff00:0:2", "luciverse"),
+        ]
+
+        async def run():
+            await sync._fetch_svid()
+            batch = await sync._batch_derive_drkeys(requests)
+            single = [await sync._derive_drkey_l3(*request) for request in requests]
+            return batch, single
+
+        batch, single = asyncio.run(run())
+
+        assert [k.key for k in batch] == [k.key for k in single]
+
+
+
+class TestLifecycle:
+    """Tests for start/stop around the KDF pool."""
+
+    def test_get_drkey_after_stop(self, sync):
+        """Test keys can still be derived after the service stops."""
+
+        async def run():
+            await run_once(sync)
+            return await sync.get_drkey("1-ff00:0:110", "3-ff00:0:330")
+
+        assert len(asyncio.run(run()).key) == 32
+
+    def test_restart(self, sync):
+        """Test the service can be started again after a stop."""
+
+        async def run():
+            await run_once(sync)
+            await run_once(sync)
+            return await sync.get_drkey("1-ff00:0:110", "2-ff00:0:220")
+
+        assert len(asyncio.run(run()).key) == 32
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
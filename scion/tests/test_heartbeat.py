@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Consciousness Heartbeat
+Genesis Bond: GB-2025-0524-DRH-LCS-001
+
+Tests the multiplexed echo dispatcher against a local UDP echo peer
+and Prometheus metric export.
+"""
+
+import asyncio
+import importlib.util
+import socket
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add lib to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "lib"))
+
+# The app lives in a hyphenated directory, so load it by path
+_spec = importlib.util.spec_from_file_location(
+    "scion_echo_heartbeat",
+    Path(__file__).parent.parent / "apps" / "scion-echo" / "heartbeat.py",
+)
+heartbeat = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = heartbeat
+_spec.loader.exec_module(heartbeat)
+
+HeartbeatMetrics = heartbeat.HeartbeatMetrics
+HeartbeatResult = heartbeat.HeartbeatResult
+HeartbeatStatus = heartbeat.HeartbeatStatus
+PingDispatcher = heartbeat.PingDispatcher
+
+
+ECHO_PACKET = heartbeat.ECHO_PACKET
+
+
+class EchoPeer(asyncio.DatagramProtocol):
+    """UDP agent that answers each echo request via a reply callback."""
+
+    def __init__(self, reply=lambda data: data):
+        self.reply = reply
+        self.transport = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        answer = self.reply(data)
+        if answer is not None:
+            self.transport.sendto(answer, addr)
+
+
+async def start_peer(reply=lambda data: data):
+    """Start an echo peer on an ephemeral port and return it with its address."""
+    loop = asyncio.get_running_loop()
+    transport, peer = await loop.create_datagram_endpoint(
+        lambda: EchoPeer(reply), local_addr=("127.0.0.1", 0)
+    )
+    return peer, transport.get_extra_info("sockname")
+
+
+async def with_dispatcher(reply, pings):
+    """Run pings against an echo peer answering with reply."""
+    peer, addr = await start_peer(reply)
+    dispatcher = PingDispatcher(port=0)
+    await dispatcher.start()
+    try:
+        return await pings(dispatcher, addr), dict(dispatcher._pending)
+    finally:
+        dispatcher.close()
+        peer.transport.close()
+
+
+class TestPingDispatcher:
+    """Tests for echo pings over one UDP socket."""
+
+    def test_port_not_shared(self):
+        """Test a second dispatcher cannot bind a port already in use."""
+
+        async def run():
+            first = PingDispatcher(port=0)
+            await first.start()
+            try:
+                second = PingDispatcher(port=first._sock.getsockname()[1])
+                with pytest.raises(OSError):
+                    await second.start()
+            finally:
+                first.close()
+
+        asyncio.run(run())
+
+    def test_concurrent_pings(self):
+        """Test many pings in flight each resolve from their own echo."""
+
+        async def pings(dispatcher, addr):
+            return await asyncio.gather(*(dispatcher.ping(addr, 1.0) for _ in range(16)))
+
+        rtts, pending = asyncio.run(with_dispatcher(lambda data: data, pings))
+
+        assert len(rtts) == 16
+        assert all(rtt >= 0 for rtt in rtts)
+        assert pending == {}
+
+    def test_hostname_peer(self):
+        """Test echoes match a peer configured by hostname."""
+
+        async def pings(dispatcher, addr):
+            return await dispatcher.ping(("localhost", addr[1]), 1.0)
+
+        rtt, _ = asyncio.run(with_dispatcher(lambda data: data, pings))
+
+        assert rtt >= 0
+
+    def test_silent_peer_times_out(self):
+        """Test a ping with no echo times out and is unregistered."""
+
+        async def pings(dispatcher, addr):
+            with pytest.raises(asyncio.TimeoutError):
+                await dispatcher.ping(addr, 0.05)
+
+        _, pending = asyncio.run(with_dispatcher(lambda data: None, pings))
+
+        assert pending == {}
+
+    def test_wrong_send_time_dropped(self):
+        """Test an echo that does not carry back our send time is ignored."""
+
+        def tamper(data):
+            seq, sent_ns = ECHO_PACKET.unpack_from(data)
+            return ECHO_PACKET.pack(seq, sent_ns + 1)
+
+        async def pings(dispatcher, addr):
+            with pytest.raises(asyncio.TimeoutError):
+                await dispatcher.ping(addr, 0.05)
+
+        asyncio.run(with_dispatcher(tamper, pings))
+
+    def test_unexpected_peer_dropped(self):
+        """Test a valid-looking echo from a different address is ignored."""
+        relay = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        relay.bind(("127.0.0.1", 0))
+        dispatcher_addr = []
+
+        def forward(data):
+            # Answer from another socket instead of the pinged one
+            relay.sendto(data, dispatcher_addr[0])
+            return None
+
+        async def pings(dispatcher, addr):
+            dispatcher_addr.append(("127.0.0.1", dispatcher._sock.getsockname()[1]))
+            with pytest.raises(asyncio.TimeoutError):
+                await dispatcher.ping(addr, 0.05)
+
+        try:
+            asyncio.run(with_dispatcher(forward, pings))
+        finally:
+            relay.close()
+
+
+
+class TestHeartbeatMetrics:
+    """Tests for Prometheus export."""
+
+    def test_no_series_before_first_sample(self):
+        """Test configured agents are not exported until they report."""
+        metrics = HeartbeatMetrics({"core": ["lucia", "judge"]})
+
+        text = metrics.to_prometheus().decode()
+
+        assert "# TYPE luciverse_heartbeat_latency_ms gauge" in text
+        assert 'agent="lucia"' not in text
+        assert 'agent="judge"' not in text
+
+    def test_series_after_sample(self):
+        """Test a recorded heartbeat exports its series."""
+        metrics = HeartbeatMetrics({"core": ["lucia", "judge"]})
+        metrics.record_heartbeat(
+            HeartbeatResult(
+                agent="lucia",
+                tier="core",
+                status=HeartbeatStatus.OK,
+                latency_ms=1.5,
+                coherence=0.9,
+                path_count=3,
+            )
+        )
+
+        text = metrics.to_prometheus().decode()
+
+        assert 'luciverse_heartbeat_latency_ms{tier="core",agent="lucia"} 1.50' in text
+        assert 'luciverse_heartbeat_coherence{tier="core",agent="lucia"} 0.9000' in text
+        assert 'luciverse_heartbeat_path_count{tier="core"} 3' in text
+        assert 'luciverse_heartbeat_status{tier="core",agent="lucia"} 1' in text
+        assert 'agent="judge"' not in text
+
+    def test_unconfigured_agent(self):
+        """Test agents outside the configured set are still exported."""
+        metrics = HeartbeatMetrics()
+        metrics.record_heartbeat(
+            HeartbeatResult(agent="aethon", tier="pac", status=HeartbeatStatus.TIMEOUT)
+        )
+
+        text = metrics.to_prometheus().decode()
+
+        assert 'luciverse_heartbeat_status{tier="pac",agent="aethon"} 0' in text
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])